@@ -1,8 +1,13 @@
-from dictknife.walkers import LooseDictWalkingIterator, DictWalker  # NOQA
+from dictknife.walkers import (  # NOQA
+    LooseDictWalkingIterator,
+    DictWalker,
+    MultiDictWalker,
+)
 from dictknife.accessing import Accessor  # NOQA
 from dictknife.accessing import dictmap  # NOQA
 from dictknife.deepmerge import deepmerge  # NOQA
 from dictknife.deepequal import deepequal  # NOQA
+from dictknife.fingerprint import fingerprint  # NOQA
 from dictknife.shape import shape  # NOQA
 from dictknife.diff import diff  # NOQA
 from dictknife.pp import pp  # NOQA
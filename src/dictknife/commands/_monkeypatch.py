@@ -23,7 +23,7 @@ def apply_loading_format_extra_arguments_parser(parser) -> None:
     mixed_parser = argparse.ArgumentParser(conflict_handler="resolve")
 
     for f in formats:
-        if f == "markdown":  # xxx:
+        if f in ("markdown", "ndjson"):  # xxx: alias
             continue
 
         m = import_module("dictknife.loading.{f}".format(f=f))
@@ -42,6 +42,7 @@ def cat(
 
     actual_input_format = input_format or format
     d: Any = make_dict()
+    pending: List[Any] = []  # dicts, merged at once (k-way)
     with contextlib.ExitStack() as s:
         for f in files:
             logger.debug("merge: %s", f)
@@ -50,7 +51,10 @@ def cat(
             )
             rf = s.enter_context(opener(f, encoding=encoding, errors=errors))
             sd: Any
-            if slurp:
+            if slurp and actual_input_format in (None, "json", "jsonl", "ndjson"):
+                # each line is a json document (loaded lazily)
+                sd = loading.load(rf, format="jsonl", errors=errors)
+            elif slurp:
                 sd = (loading.loads(line, format=actual_input_format) for line in rf)
             else:
                 sd = loading.load(rf, format=actual_input_format, errors=errors)
@@ -60,8 +64,11 @@ def cat(
             if len(files) == 1:
                 d = sd
             elif hasattr(sd, "keys"):
-                d = deepmerge(d, sd, method=merge_method)
+                pending.append(sd)
             else:
+                if pending:
+                    d = deepmerge(d, *pending, method=merge_method, inplace=True)
+                    pending.clear()
                 if not isinstance(d, (list, tuple)):
                     d = [d] if d else []
                 d = deepmerge(
@@ -74,6 +81,8 @@ def cat(
                     ),
                     method=merge_method,
                 )
+        if pending:
+            d = deepmerge(d, *pending, method=merge_method, inplace=True)
 
         loading.dumpfile(
             d, dst, format=(output_format or format), sort_keys=sort_keys, extra=extra
@@ -109,11 +118,18 @@ def transform(
         transform = lambda x: x  # NOQA
 
     input_format = input_format or format
-    data = loading.loadfile(src, input_format)
-    result = transform(data)
-    loading.dumpfile(
-        result, dst, format=output_format or input_format or format, sort_keys=sort_keys
-    )
+    actual_input_format = input_format or loading.guess_format(src)
+    with loading.openfile(src, input_format) as data:
+        # jsonl is passed as iterator (streaming), the others are the same as loadfile()
+        if actual_input_format not in ("jsonl", "ndjson") and hasattr(data, "__next__"):
+            data = list(data)
+        result = transform(data)
+        loading.dumpfile(
+            result,
+            dst,
+            format=output_format or input_format or format,
+            sort_keys=sort_keys,
+        )
 
 
 def diff(
@@ -181,10 +197,24 @@ def diff(
                     normalize=normalize,
                 )
                 if skip_empty:
-                    rows = [row for row in rows if row[diff_key] not in ("", 0)]
+                    rows = (row for row in rows if row[diff_key] not in ("", 0))
                 loading.dumpfile(rows, format=output_format)
 
 
+def _summarize_file(f, input_format: Optional[str], squash: bool):
+    from dictknife.shape import Traverser
+
+    with _open(f) as rf:
+        loaded_data = loading.load(rf, format=input_format)
+        return Traverser().traverse_items(loaded_data if squash else [loaded_data])
+
+
+def _summarize_jsonl_lines(lines: List[str]):
+    from dictknife.shape import Traverser
+
+    return Traverser().traverse_items(loading.loads("".join(lines), format="jsonl"))
+
+
 def shape(
     *,
     files: List[Any],
@@ -196,20 +226,67 @@ def shape(
     with_type: bool,
     with_example: bool,
     full: bool,
+    jobs: Optional[int] = None,
+    chunk_size: int = 10000,
 ) -> None:
     """shape"""
+    from concurrent.futures import Future, ProcessPoolExecutor
+    from functools import partial
+    from collections import deque
     from dictknife import shape as shape_module
-
-    dataset: List[Any] = []
-    for f in files:
-        with _open(f) as rf:
-            loaded_data = loading.load(rf, format=input_format)
-            if squash:
-                dataset.extend(loaded_data)
+    from dictknife.shape import merge_states
+
+    # each file (or each chunk of lines of jsonl) is summarized independently,
+    # and the partial states are merged in order
+    def _submit(executor, fn, *args) -> Future:
+        if executor is None or args[0] is sys.stdin:
+            future: Future = Future()
+            future.set_result(fn(*args))
+            return future
+        return executor.submit(fn, *args)
+
+    def _iterate_futures(executor):
+        for f in files:
+            fmt = input_format
+            if fmt is None and f is not sys.stdin:
+                fmt = loading.guess_format(f)
+            if executor is not None and squash and fmt == "jsonl":
+                with _open(f) as rf:
+                    while True:
+                        lines = list(itertools.islice(rf, chunk_size))
+                        if not lines:
+                            break
+                        yield executor.submit(_summarize_jsonl_lines, lines)
             else:
-                dataset.append(loaded_data)
+                yield _submit(executor, _summarize_file, f, input_format, squash)
+
+    def _iterate_states(executor):
+        pending: deque = deque()  # bounded, not to read all of the inputs at once
+        for future in _iterate_futures(executor):
+            pending.append(future)
+            if len(pending) > (jobs or 1) * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    with contextlib.ExitStack() as s:
+        executor = None
+        if jobs is not None and jobs > 1:
+            # the settings of loading.setup() are not inherited on spawn start method
+            executor = s.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=jobs,
+                    initializer=partial(loading.setup, **loading.get_settings()),
+                )
+            )
+        state = merge_states(_iterate_states(executor))
+
     rows: List[Any] = shape_module(
-        dataset, squash=True, skiplist=skiplist, separator=separator
+        state,
+        traverse=lambda state: state,
+        squash=True,
+        skiplist=skiplist,
+        separator=separator,
     )
 
     r: List[Dict[str, Any]] = []
@@ -332,6 +409,15 @@ def main():
         help="-",
     )
     parser.add_argument("-q", "--quiet", action="store_true", help="-")
+    parser.add_argument(
+        "--json-backend", default=None, choices=loading.get_json_backends(), help="-"
+    )
+    parser.add_argument(
+        "--yaml-typ",
+        default=None,
+        choices=["rt", "safe"],
+        help="rt: round trip (preserving comments), safe: fast",
+    )
     parser.add_argument("--debug", action="store_true", help="-")
 
     # modification
@@ -489,7 +575,8 @@ def main():
     sparser = subparsers.add_parser(
         diff.__name__, help=diff.__doc__, formatter_class=parser.formatter_class
     )
-    sparser.set_defaults(subcommand=fn)
+    # read only, so round trip information (comments, quotes) is not needed
+    sparser.set_defaults(subcommand=fn, default_yaml_typ="safe")
     sparser.add_argument("--normalize", action="store_true", help="-")
     sparser.add_argument("--verbose", action="store_true", help="-")
     sparser.add_argument("left", help="-")
@@ -520,13 +607,15 @@ def main():
             with_type=args.with_type,
             with_example=args.with_example,
             full=args.full,
+            jobs=args.jobs,
         )
 
     fn = run_shape
     sparser = subparsers.add_parser(
         shape.__name__, help=shape.__doc__, formatter_class=parser.formatter_class
     )
-    sparser.set_defaults(subcommand=fn)
+    # read only, so round trip information (comments, quotes) is not needed
+    sparser.set_defaults(subcommand=fn, default_yaml_typ="safe")
     sparser.add_argument("files", nargs="*", default=[sys.stdin], help="-")
     sparser.add_argument("--squash", action="store_true", help="-")
     sparser.add_argument("--skiplist", action="store_true", help="-")
@@ -534,6 +623,13 @@ def main():
     sparser.add_argument("--with-type", action="store_true", help="-")
     sparser.add_argument("--with-example", action="store_true", help="-")
     sparser.add_argument("--separator", default="/", help="-")
+    sparser.add_argument(
+        "-j",
+        "--jobs",
+        default=None,
+        type=int,
+        help="the number of processes, summarizing each file (or each chunk of jsonl) in parallel",
+    )
     sparser.add_argument(
         "-i", "--input-format", default=None, choices=formats, help="-"
     )
@@ -605,6 +701,11 @@ def main():
             warnings.simplefilter("ignore")
 
         logging.basicConfig(level=getattr(logging, params.pop("log_level")))
+        default_yaml_typ = params.pop("default_yaml_typ", None)
+        loading.setup(
+            json_backend=params.pop("json_backend"),
+            yaml_typ=params.pop("yaml_typ") or default_yaml_typ,
+        )
 
         with traceback_shortly(params.pop("debug")):
             # apply modification
@@ -84,14 +84,23 @@ def bundle(
     format: Optional[str],
     flavor: Optional[str],
     extras: Optional[List[str]] = None,
+    jobs: Optional[int] = None,
 ) -> None:
-    from dictknife.jsonknife import bundle as bundle_module
+    from dictknife.jsonknife import bundle as bundle_module, Prefetcher
 
     if ref is not None and src is not None:
         src = "{prefix}#/{name}".format(prefix=src, name=ref.lstrip("#/"))
-    result = bundle_module(
-        src, format=input_format or format, extras=extras, flavor=flavor
-    )
+    with contextlib.ExitStack() as s:
+        prefetcher = None
+        if jobs is not None and jobs > 1:
+            prefetcher = s.enter_context(Prefetcher.from_processes(max_workers=jobs))
+        result = bundle_module(
+            src,
+            format=input_format or format,
+            extras=extras,
+            flavor=flavor,
+            prefetcher=prefetcher,
+        )
     loading.dumpfile(result, dst, format=output_format or format)
 
 
@@ -148,6 +157,29 @@ def examples(
     loading.dumpfile(d, dst, format=output_format or format or "json")
 
 
+def patch(
+    *,
+    src: Optional[str],
+    dst: Optional[str] = None,
+    patches: List[str],
+    input_format: Optional[str],
+    output_format: Optional[str],
+    format: Optional[str],
+) -> None:
+    """apply json patch (RFC 6902), or json merge patch (RFC 7396) if it is a dict"""
+    from dictknife.jsonknife.patch import apply_patch
+    from dictknife.jsonknife.merge import merge
+
+    d = loading.loadfile(src, format=input_format or format)
+    for filename in patches:
+        ops = loading.loadfile(filename)
+        if hasattr(ops, "keys"):
+            d = merge(d, ops, make_dict=make_dict)
+        else:
+            d = apply_patch(d, ops, inplace=True)
+    loading.dumpfile(d, dst, format=output_format or format)
+
+
 def main():
     import argparse
 
@@ -168,6 +200,15 @@ def main():
         help="-",
     )
     parser.add_argument("-q", "--quiet", action="store_true", help="-")
+    parser.add_argument(
+        "--json-backend", default=None, choices=loading.get_json_backends(), help="-"
+    )
+    parser.add_argument(
+        "--yaml-typ",
+        default=None,
+        choices=["rt", "safe"],
+        help="rt: round trip (preserving comments), safe: fast",
+    )
     parser.add_argument("--debug", action="store_true", help="-")
 
     subparsers = parser.add_subparsers(dest="subcommand", title="subcommands")
@@ -259,6 +300,7 @@ def main():
             format=args.format,
             flavor=args.flavor,
             extras=args.extras,
+            jobs=args.jobs,
         )
 
     fn = run_bundle
@@ -280,6 +322,13 @@ def main():
         "-o", "--output-format", default=None, choices=formats, help="-"
     )
     sparser.add_argument("--extra", default=None, nargs="+", dest="extras", help="-")
+    sparser.add_argument(
+        "-j",
+        "--jobs",
+        default=None,
+        type=int,
+        help="the number of processes, for loading referenced files in parallel",
+    )
 
     # separate
     def run_separate(args: argparse.Namespace) -> None:
@@ -337,6 +386,35 @@ def main():
         "-o", "--output-format", default=None, choices=formats, help="-"
     )
 
+    # patch
+    def run_patch(args: argparse.Namespace) -> None:
+        patch(
+            src=args.src,
+            dst=args.dst,
+            patches=args.patches,
+            input_format=args.input_format,
+            output_format=args.output_format,
+            format=args.format,
+        )
+
+    fn = run_patch
+    sparser = subparsers.add_parser(
+        patch.__name__, help=patch.__doc__, formatter_class=parser.formatter_class
+    )
+    sparser.set_defaults(subcommand=fn)
+    sparser.add_argument("src", nargs="?", default=None, help="-")
+    sparser.add_argument("--dst", default=None, help="-")
+    sparser.add_argument(
+        "-p", "--patch", dest="patches", action="append", required=True, help="-"
+    )
+    sparser.add_argument("-f", "--format", default=None, choices=formats, help="-")
+    sparser.add_argument(
+        "-i", "--input-format", default=None, choices=formats, help="-"
+    )
+    sparser.add_argument(
+        "-o", "--output-format", default=None, choices=formats, help="-"
+    )
+
     args = parser.parse_args()
 
     with contextlib.ExitStack() as s:
@@ -346,6 +424,9 @@ def main():
             s.enter_context(warnings.catch_warnings())
             warnings.simplefilter("ignore")
         logging.basicConfig(level=getattr(logging, params.pop("log_level")))
+        loading.setup(
+            json_backend=params.pop("json_backend"), yaml_typ=params.pop("yaml_typ")
+        )
         with traceback_shortly(params.pop("debug")):
             subcommand_func = params.pop("subcommand")
             return subcommand_func(argparse.Namespace(**params))
@@ -119,7 +119,7 @@ def merge(
     elif style == "whole":
         # TODO: strict support?
         loaded_data = [loading.loadfile(src_file) for src_file in files]
-        r = deepmerge(*loaded_data, override=True)
+        r = deepmerge(make_dict(), *loaded_data, method="replace", inplace=True)
     else:
         raise RuntimeError("invalid style: {}".format(style))
 
@@ -198,6 +198,15 @@ def main():
         help="-",
     )
     parser.add_argument("-q", "--quiet", action="store_true", help="-")
+    parser.add_argument(
+        "--json-backend", default=None, choices=loading.get_json_backends(), help="-"
+    )
+    parser.add_argument(
+        "--yaml-typ",
+        default=None,
+        choices=["rt", "safe"],
+        help="rt: round trip (preserving comments), safe: fast",
+    )
     parser.add_argument("--debug", action="store_true", help="-")
 
     subparsers = parser.add_subparsers(dest="subcommand", title="subcommands")
@@ -314,6 +323,9 @@ def main():
             s.enter_context(warnings.catch_warnings())
             warnings.simplefilter("ignore")
         logging.basicConfig(level=getattr(logging, params.pop("log_level")))
+        loading.setup(
+            json_backend=params.pop("json_backend"), yaml_typ=params.pop("yaml_typ")
+        )
         with traceback_shortly(params.pop("debug")):
             subcommand_func = params.pop("subcommand")
             return subcommand_func(argparse.Namespace(**params))
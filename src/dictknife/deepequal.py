@@ -1,4 +1,9 @@
+from collections import defaultdict
 from .langhelpers import reify
+from .fingerprint import Fingerprinter
+
+_atoms = frozenset([str, int, float, bool, type(None)])
+_unhashable = object()  # the bucket of unhashable objects
 
 
 def deepequal(d0, d1, normalize: bool = False):
@@ -7,17 +12,105 @@ def deepequal(d0, d1, normalize: bool = False):
     Args:
         d0: The first dictionary-like object.
         d1: The second dictionary-like object.
-        normalize (bool, optional): If True, sorts lists and dictionary keys
-            before comparison. This allows for equality checks even if the
-            order of elements is different. Defaults to False.
+        normalize (bool, optional): If True, the order of the elements in lists
+            is ignored (lists are compared as multisets). Defaults to False.
 
     Returns:
         True if the objects are deeply equal, False otherwise.
     """
     if normalize:
-        d0 = sort_flexibly(d0)
-        d1 = sort_flexibly(d1)
-    return halfequal(d0, d1) and halfequal(d1, d0)
+        return _Comparator().equal(d0, d1)
+    return _equal(d0, d1)
+
+
+def _equal(left, right) -> bool:
+    # single pass, returns at the first difference
+    if hasattr(left, "keys"):
+        if not hasattr(right, "keys") or len(left) != len(right):
+            return False
+        for k, x in left.items():
+            if k not in right:
+                return False
+            y = right[k]
+            if x is y:
+                continue
+            elif x.__class__ in _atoms:
+                if not x == y:
+                    return False
+            elif not _equal(x, y):
+                return False
+        return True
+    elif isinstance(left, (list, tuple)):
+        if not isinstance(right, (list, tuple)) or len(left) != len(right):
+            return False
+        for x, y in zip(left, right):
+            if x is y:
+                continue
+            elif x.__class__ in _atoms:
+                if not x == y:
+                    return False
+            elif not _equal(x, y):
+                return False
+        return True
+    else:
+        return left == right
+
+
+class _Comparator:
+    """deepequal(normalize=True), lists are compared as multisets.
+
+    The elements are bucketed by their (order-insensitive) fingerprints, so
+    only the elements in the same bucket are compared."""
+
+    def __init__(self) -> None:
+        self.fingerprinter = Fingerprinter(unordered=True)
+
+    def equal(self, left, right) -> bool:
+        if left is right:
+            return True
+        elif hasattr(left, "keys"):
+            if not hasattr(right, "keys") or len(left) != len(right):
+                return False
+            for k, x in left.items():
+                if k not in right or not self.equal(x, right[k]):
+                    return False
+            return True
+        elif isinstance(left, (list, tuple)):
+            if not isinstance(right, (list, tuple)) or len(left) != len(right):
+                return False
+            for i, (x, y) in enumerate(zip(left, right)):
+                if not self.equal(x, y):  # not in the same order
+                    return self._equal_multiset(left[i:], right[i:])
+            return True
+        else:
+            return left == right
+
+    def _equal_multiset(self, left, right) -> bool:
+        buckets = defaultdict(list)
+        for y in right:
+            buckets[self._bucket_key(y)].append(y)
+        for x in left:
+            candidates = buckets.get(self._bucket_key(x))
+            if not candidates:
+                return False
+            for i, y in enumerate(candidates):
+                if self.equal(x, y):
+                    del candidates[i]
+                    break
+            else:
+                return False
+        return True
+
+    def _bucket_key(self, x):
+        if x.__class__ in _atoms:
+            return x
+        elif hasattr(x, "keys") or isinstance(x, (list, tuple)):
+            return self.fingerprinter.digest(x)
+        try:
+            hash(x)
+            return x
+        except TypeError:
+            return _unhashable
 
 
 def sort_flexibly(ob):
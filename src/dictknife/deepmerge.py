@@ -1,17 +1,113 @@
 import copy
 import warnings
 import itertools
-from functools import partial
 from dictknife.langhelpers import make_dict
 
+_missing = object()
+_atoms = frozenset([str, int, float, bool, type(None)])
+
+
+def _hashkey(x):
+    # if x == y, then _hashkey(x) == _hashkey(y) (the reverse is not always true)
+    if x.__class__ in _atoms:
+        return x
+    elif hasattr(x, "keys"):
+        items = []
+        for k, v in x.items():
+            if v.__class__ not in _atoms:
+                v = _hashkey(v)
+                if v is _missing:
+                    return _missing
+            items.append((k, v))
+        try:
+            return (dict, frozenset(items))
+        except TypeError:
+            return _missing
+    elif not isinstance(x, list):
+        try:
+            hash(x)
+            return x
+        except TypeError:
+            pass
+
+    if isinstance(x, (list, tuple)):
+        items = []
+        for v in x:
+            if v.__class__ not in _atoms:
+                v = _hashkey(v)
+                if v is _missing:
+                    return _missing
+            items.append(v)
+        return (list, tuple(items))
+    elif isinstance(x, (set, frozenset)):
+        return frozenset(x)  # == frozenset
+    return _missing
+
+
+class _Dedup:
+    """The same as `e in r` for the list, with hash-based index.
+
+    The elements are bucketed by _hashkey(), and compared with `==`, as list does.
+    The elements that have no key (e.g. unknown unhashable objects) are compared
+    with all elements (as the list)."""
+
+    def __init__(self, r: list) -> None:
+        self.r = r
+        self.firsts: dict = {}  # key -> the first element
+        self.others: dict = {}  # key -> the other elements (not equal to the first)
+        self.nokeys: list = []
+        for x in r:
+            self._add(x)
+
+    def _add(self, x) -> None:
+        k = _hashkey(x)
+        if k is _missing:
+            self.nokeys.append(x)
+        elif k not in self.firsts:
+            self.firsts[k] = x
+        else:
+            self.others.setdefault(k, []).append(x)
+
+    def __contains__(self, e) -> bool:
+        k = _hashkey(e)
+        if k is _missing:
+            return e in self.r
+        x = self.firsts.get(k, _missing)
+        if x is not _missing:
+            if x is e or x == e:
+                return True
+            for x in self.others.get(k, ()):
+                if x is e or x == e:
+                    return True
+        for x in self.nokeys:
+            if x is e or x == e:
+                return True
+        return False
+
+    def append(self, e) -> None:
+        self.r.append(e)
+        self._add(e)
+
+
+def _extend_list(r: list, right, *, dedup: bool) -> None:
+    if not dedup:
+        r.extend(right)
+    elif len(r) + len(right) <= 16:  # small, linear search is faster
+        for e in right:
+            if e not in r:
+                r.append(e)
+    else:
+        index = _Dedup(r)
+        for e in right:
+            if e not in index:
+                index.append(e)
+
 
 def _deepmerge_extend(left, right, *, dedup: bool = False):
     if isinstance(left, list):
         r = left[:]
         if isinstance(right, list):
-            for e in right:
-                if not (dedup and e in r):
-                    r.append(e)
+            _extend_list(r, right, dedup=dedup)
         else:
             if not (dedup and right in r):
                 r.append(right)
@@ -19,9 +115,7 @@ def _deepmerge_extend(left, right, *, dedup: bool = False):
     elif isinstance(left, tuple):
         r = list(left)
         if isinstance(right, tuple):
-            for e in right:
-                if not (dedup and e in r):
-                    r.append(e)
+            _extend_list(r, right, dedup=dedup)
         else:
             if not (dedup and right in r):
                 r.append(right)
@@ -45,6 +139,78 @@ def _deepmerge_extend(left, right, *, dedup: bool = False):
         return right
 
 
+def _deepmerge_extend_many(values: list, *, dedup: bool = False, owned: bool = False):
+    """k-way version of _deepmerge_extend()
+
+    The same as `functools.reduce(_deepmerge_extend, values)`, but the values
+    of the same key are merged at once, so each level is copied only once.
+    If owned is True, values[0] is updated in place (instead of copied)."""
+    left = values[0]
+    for i in range(1, len(values)):
+        if isinstance(left, (list, tuple)):
+            return _extend_seq_many(left, values[i:], dedup=dedup, owned=owned)
+        elif hasattr(left, "get"):
+            return _extend_dict_many(left, values[i:], dedup=dedup, owned=owned)
+        else:
+            left = values[i]
+            owned = False
+    return left
+
+
+def _extend_seq_many(left, rights: list, *, dedup: bool, owned: bool):
+    seq_type = list if isinstance(left, list) else tuple
+    r = left if owned and seq_type is list else list(left)
+    items_list = [right if isinstance(right, seq_type) else [right] for right in rights]
+    if not dedup:
+        for items in items_list:
+            r.extend(items)
+    elif len(r) + sum(len(items) for items in items_list) <= 16:
+        for items in items_list:
+            for e in items:
+                if e not in r:
+                    r.append(e)
+    else:
+        index = _Dedup(r)
+        for items in items_list:
+            for e in items:
+                if e not in index:
+                    index.append(e)
+    return r if seq_type is list else tuple(r)
+
+
+def _extend_dict_many(left, rights: list, *, dedup: bool, owned: bool):
+    r = left  # copied, when merging with the first dict (if not owned)
+    multi: dict = {}  # key -> values (appeared two or more times)
+    shared: set = set()  # keys whose values are taken from rights (if owned)
+    error = None
+    for right in rights:
+        if right is None:
+            continue
+        elif not hasattr(right, "get"):
+            error = right
+            break
+
+        if r is left and not owned:
+            r = left.copy()
+        for k in right.keys():
+            if k not in r:
+                r[k] = right[k]
+                if owned:
+                    shared.add(k)
+            elif k in multi:
+                multi[k].append(right[k])
+            else:
+                multi[k] = [r[k], right[k]]
+
+    for k, values in multi.items():
+        r[k] = _deepmerge_extend_many(
+            values, dedup=dedup, owned=owned and k not in shared
+        )
+    if error is not None:
+        raise ValueError("cannot merge dict and non-dict: left=%s, right=%s", r, error)
+    return r
+
+
 def _deepmerge_replace(left, right):
     if hasattr(right, "keys"):
         for k, v in right.items():
@@ -59,7 +225,34 @@ def _deepmerge_replace(left, right):
         return right
 
 
-def _deepmerge_merge(left, right):
+def _deepmerge_replace_shared(left, right, *, owned: bool, shared: set):
+    # copy-on-write version of _deepmerge_replace(), the values of right are not copied
+    # (shared has the ids of them, they are copied before updating)
+    if hasattr(right, "keys"):
+        if not owned and hasattr(left, "keys"):
+            left = left.copy()
+            # the children are not copied
+            shared.update(id(v) for v in left.values() if v.__class__ not in _atoms)
+        for k, v in right.items():
+            if k not in left:
+                left[k] = v
+                if v.__class__ not in _atoms:
+                    shared.add(id(v))
+            elif v.__class__ in _atoms:
+                left[k] = v
+            else:
+                x = left[k]
+                left[k] = _deepmerge_replace_shared(
+                    x, v, owned=owned and id(x) not in shared, shared=shared
+                )
+        return left
+    else:
+        if right.__class__ not in _atoms:
+            shared.add(id(right))
+        return right
+
+
+def _deepmerge_merge(left, right, *, owned: bool = False):
     if isinstance(left, (list, tuple)):
         if not isinstance(right, (list, tuple)):
             right = [right]
@@ -74,7 +267,7 @@ def _deepmerge_merge(left, right):
         return r
     elif hasattr(left, "get"):
         if hasattr(right, "get"):
-            r = left.copy()
+            r = left if owned else left.copy()
             for k in right.keys():
                 if k in left:
                     r[k] = _deepmerge_extend(r[k], right[k])
@@ -94,7 +287,9 @@ def _deepmerge_merge(left, right):
 METHODS = ["merge", "append", "addtoset", "replace"]
 
 
-def deepmerge(*ds, override: bool = False, method: str = "addtoset"):
+def deepmerge(
+    *ds, override: bool = False, method: str = "addtoset", inplace: bool = False
+):
     """Recursively merges multiple dictionary-like objects.
 
     Args:
@@ -112,9 +307,14 @@ def deepmerge(*ds, override: bool = False, method: str = "addtoset"):
             - 'replace': Replaces the value in the left dictionary with the value from the right.
                          For lists and tuples, the entire list/tuple is replaced.
             Defaults to "addtoset".
+        inplace (bool, optional): If True, the first object is updated in place and
+            returned, and the values of the others are shared instead of copied
+            (copy-on-write: the shared values are copied before updating, so only
+            the first object is modified). Defaults to False.
 
     Returns:
-        A new dictionary-like object containing the merged data.
+        A new dictionary-like object containing the merged data
+        (or the first object, if inplace is True).
 
     Raises:
         ValueError: If an invalid merge method is provided.
@@ -127,24 +327,42 @@ def deepmerge(*ds, override: bool = False, method: str = "addtoset"):
             "override option is deprecated, will be removed, near future",
             category=DeprecationWarning,
         )
-        merge = _deepmerge_replace
-    elif method == "addtoset":
-        merge = partial(_deepmerge_extend, dedup=True)
-    elif method == "append":
-        merge = partial(_deepmerge_extend, dedup=False)
-    elif method == "merge":
-        merge = _deepmerge_merge
-    elif method == "replace":
-        merge = _deepmerge_replace
-    else:
+        method = "replace"
+    elif method not in METHODS:
         raise ValueError(
             "unavailable method not in {METHODS!r}".format(METHODS=METHODS)
         )
 
-    left = ds[0].__class__()
+    # left is owned (updated in place), the new one or the first one (if inplace)
+    if inplace and hasattr(ds[0], "keys"):
+        left, ds = ds[0], ds[1:]
+    else:
+        left = ds[0].__class__()
 
-    for right in ds:
-        if not right:
-            continue
-        left = merge(left, right)
-    return left
+    if method in ("addtoset", "append"):
+        rights = [right for right in ds if right]
+        return _deepmerge_extend_many(
+            [left, *rights], dedup=(method == "addtoset"), owned=True
+        )
+    elif method == "merge":
+        owned = True
+        for right in ds:
+            if not right:
+                continue
+            r = _deepmerge_merge(left, right, owned=owned)
+            owned, left = r is not right, r
+        return left
+    elif inplace:  # replace
+        owned, shared = True, set()
+        for right in ds:
+            if not right:
+                continue
+            r = _deepmerge_replace_shared(left, right, owned=owned, shared=shared)
+            owned, left = owned and r is left, r
+        return left
+    else:  # replace
+        for right in ds:
+            if not right:
+                continue
+            left = _deepmerge_replace(left, right)
+        return left
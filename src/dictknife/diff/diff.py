@@ -1,8 +1,13 @@
+import json
 import difflib
+from bisect import bisect_right
+from difflib import SequenceMatcher
 from dictknife.deepequal import sort_flexibly
 from dictknife.transform import str_dict
 from typing import Optional, Callable
 
+_atoms = frozenset([str, int, float, bool, type(None)])
+
 
 def diff(
     d0,
@@ -22,6 +27,8 @@ def diff(
         d1: The second dictionary-like object.
         tostring (callable, optional): A function to convert the objects to strings
             for comparison. Defaults to a JSON string representation with indentation.
+            (if not given, the objects are compared structurally, and only the lines
+            of the changed regions are rendered)
         fromfile (str, optional): Label for the first object in the diff output.
             Defaults to "left".
         tofile (str, optional): Label for the second object in the diff output.
@@ -50,8 +57,15 @@ def diff(
         d0 = list(d0)
     if hasattr(d1, "__next__"):
         d1 = list(d1)
-    tostring = tostring or _default_tostring
+    if tostring is None and terminator == "\n":  # structural diff
+        # the errors are raised here (e.g. unsupported keys), as same as json.dumps()
+        json.dumps([d0, d1], sort_keys=sort_keys, default=str)
+        doc0 = _Document(d0, sort_keys=sort_keys)
+        doc1 = _Document(d1, sort_keys=sort_keys)
+        opcodes = _Aligner(doc0, doc1).align()
+        return _unified_diff(doc0, doc1, opcodes, fromfile=fromfile, tofile=tofile, n=n)
 
+    tostring = tostring or _default_tostring
     s0 = tostring(d0, sort_keys=sort_keys).split(terminator)
     s1 = tostring(d1, sort_keys=sort_keys).split(terminator)
     return difflib.unified_diff(
@@ -60,13 +74,302 @@ def diff(
 
 
 def _default_tostring(d, *, default=str, sort_keys: bool = True):
-    import json
-
     return json.dumps(
         d, indent=2, ensure_ascii=False, sort_keys=sort_keys, default=default
     )
 
 
+# structural diff
+# ----------------------------------------
+#
+# - the lines are the same as _default_tostring() (json.dumps(indent=2)), but
+#   rendered lazily, only the lines of the changed regions (and the context) are
+#   rendered (_Document)
+# - the opcodes (the same as SequenceMatcher.get_opcodes()) are computed by walking
+#   the both values together. the identical subtrees are skipped, the children of
+#   dicts are aligned by keys, the elements of lists are aligned by their contents
+# - only the lines in the changed regions are compared by SequenceMatcher
+
+
+class _Document:
+    """The lines of _default_tostring(d), rendered lazily."""
+
+    def __init__(self, d, *, sort_keys: bool) -> None:
+        self.d = d
+        self.sort_keys = sort_keys
+        self._counts: dict[int, int] = {}  # id(container) -> the number of lines
+        self._children: dict[int, tuple] = (
+            {}
+        )  # id(container) -> (heads, values, offsets)
+
+    def __len__(self) -> int:
+        return self.count(self.d)
+
+    def __getitem__(self, s: slice) -> list[str]:
+        return self.lines(s.start, s.stop)
+
+    def count(self, x) -> int:
+        """Returns the number of the lines of the value."""
+        if not isinstance(x, (dict, list, tuple)) or not x:
+            return 1
+        k = id(x)
+        n = self._counts.get(k)
+        if n is None:
+            n = 2  # "{" and "}"
+            for v in x.values() if isinstance(x, dict) else x:
+                n += 1 if v.__class__ in _atoms else self.count(v)
+            self._counts[k] = n
+        return n
+
+    def children(self, x) -> tuple[list[str], list, list[int]]:
+        """Returns the heads ('"key": '), values, and start lines (relative) of children."""
+        k = id(x)
+        r = self._children.get(k)
+        if r is None:
+            if isinstance(x, dict):
+                keys = sorted(x) if self.sort_keys else list(x)
+                heads = [_dumps(_key_as_str(k)) + ": " for k in keys]
+                values = [x[k] for k in keys]
+            else:
+                heads = [""] * len(x)
+                values = x
+            offsets = [1]
+            n = 1
+            for v in values:
+                n += 1 if v.__class__ in _atoms else self.count(v)
+                offsets.append(n)
+            r = self._children[k] = (heads, values, offsets)
+        return r
+
+    def lines(self, i: int, j: int) -> list[str]:
+        r: list[str] = []
+        self._collect(self.d, 0, 0, "", "", i, j, r)
+        return r
+
+    def _collect(self, x, start: int, level: int, head: str, tail: str, i, j, r):
+        n = self.count(x)
+        if start >= j or start + n <= i:
+            return
+        indent = "  " * level
+        if n == 1:
+            r.append(indent + head + _dumps(x) + tail)
+        elif i <= start and start + n <= j:  # whole
+            lines = _default_tostring(x, sort_keys=self.sort_keys).split("\n")
+            r.append(indent + head + lines[0])
+            r.extend([indent + line for line in lines[1:-1]])
+            r.append(indent + lines[-1] + tail)
+        else:
+            is_dict = isinstance(x, dict)
+            if start >= i:
+                r.append(indent + head + ("{" if is_dict else "["))
+            heads, values, offsets = self.children(x)
+            last = len(values) - 1
+            for c in range(max(bisect_right(offsets, i - start) - 1, 0), last + 1):
+                if start + offsets[c] >= j:
+                    break
+                self._collect(
+                    values[c],
+                    start + offsets[c],
+                    level + 1,
+                    heads[c],
+                    "," if c < last else "",
+                    i,
+                    j,
+                    r,
+                )
+            if i <= start + n - 1 < j:
+                r.append(indent + ("}" if is_dict else "]") + tail)
+
+
+class _Aligner:
+    def __init__(self, doc0: _Document, doc1: _Document) -> None:
+        self.doc0 = doc0
+        self.doc1 = doc1
+        self.opcodes: list[list] = []
+
+    def align(self) -> list[list]:
+        self._align(self.doc0.d, self.doc1.d, 0, 0, "", "", "", "")
+        return self.opcodes
+
+    def _align(self, x, y, i: int, j: int, xhead, yhead, xtail, ytail) -> None:
+        i2 = i + self.doc0.count(x)
+        j2 = j + self.doc1.count(y)
+        if xhead == yhead and xtail == ytail and self._same(x, y):
+            self._emit("equal", i, i2, j, j2)
+        elif i2 - i == 1 or j2 - j == 1:  # scalars or empty containers
+            self._compare_lines(i, i2, j, j2)
+        elif isinstance(x, dict) == isinstance(
+            y, dict
+        ):  # dict and dict, or list and list
+            self._align_children(x, y, i, j)
+        else:
+            self._compare_lines(i, i2, j, j2)
+
+    def _align_children(self, x, y, i: int, j: int) -> None:
+        xheads, xs, xoffsets = self.doc0.children(x)
+        yheads, ys, yoffsets = self.doc1.children(y)
+        xlast, ylast = len(xs) - 1, len(ys) - 1
+        self._compare_lines(i, i + 1, j, j + 1)  # "{" or "["
+
+        if isinstance(x, dict):
+            xkeys, ykeys = xheads, yheads
+        else:
+            dumps = self._dumps
+            xkeys, ykeys = [dumps(v) for v in xs], [dumps(v) for v in ys]
+        if xkeys == ykeys:
+            opcodes = [("equal", 0, len(xkeys), 0, len(ykeys))]
+        else:
+            opcodes = SequenceMatcher(None, xkeys, ykeys, autojunk=False).get_opcodes()
+        for tag, a1, a2, b1, b2 in opcodes:
+            if tag == "equal" or (tag == "replace" and a2 - a1 == b2 - b1):
+                for a, b in zip(range(a1, a2), range(b1, b2)):
+                    self._align(
+                        xs[a],
+                        ys[b],
+                        i + xoffsets[a],
+                        j + yoffsets[b],
+                        xheads[a],
+                        yheads[b],
+                        "," if a < xlast else "",
+                        "," if b < ylast else "",
+                    )
+            else:
+                self._compare_lines(
+                    i + xoffsets[a1],
+                    i + xoffsets[a2],
+                    j + yoffsets[b1],
+                    j + yoffsets[b2],
+                )
+
+        i2, j2 = i + xoffsets[-1], j + yoffsets[-1]
+        self._compare_lines(i2, i2 + 1, j2, j2 + 1)  # "}" or "]"
+
+    def _same(self, x, y) -> bool:
+        # rendered as the same lines (e.g. 1 == 1.0 == True, but not the same)
+        return x is y or (x == y and self._dumps(x) == self._dumps(y))
+
+    def _dumps(self, x) -> str:
+        return _dumps(x, sort_keys=self.doc0.sort_keys)
+
+    def _compare_lines(self, i1: int, i2: int, j1: int, j2: int) -> None:
+        if i1 == i2 or j1 == j2:
+            self._emit("replace", i1, i2, j1, j2)
+            return
+        a = self.doc0.lines(i1, i2)
+        b = self.doc1.lines(j1, j2)
+        if len(a) == len(b) == 1:
+            self._emit("equal" if a == b else "replace", i1, i2, j1, j2)
+            return
+        for tag, a1, a2, b1, b2 in SequenceMatcher(None, a, b).get_opcodes():
+            self._emit(tag, i1 + a1, i1 + a2, j1 + b1, j1 + b2)
+
+    def _emit(self, tag: str, i1: int, i2: int, j1: int, j2: int) -> None:
+        if i1 == i2 and j1 == j2:
+            return
+        if tag != "equal":
+            tag = (
+                "replace" if i1 < i2 and j1 < j2 else "delete" if i1 < i2 else "insert"
+            )
+
+        opcodes = self.opcodes
+        if opcodes:
+            prev = opcodes[-1]
+            assert prev[2] == i1 and prev[4] == j1, (prev, i1, j1)  # contiguous
+            if (prev[0] == "equal") == (tag == "equal"):  # merge
+                prev[2], prev[4] = i2, j2
+                if tag != "equal" and prev[0] != tag:
+                    prev[0] = "replace"
+                return
+        opcodes.append([tag, i1, i2, j1, j2])
+
+
+def _dumps(x, *, sort_keys: bool = False) -> str:
+    # compact (c implementation), for comparison
+    return json.dumps(x, ensure_ascii=False, sort_keys=sort_keys, default=str)
+
+
+def _key_as_str(k) -> str:
+    # the same as json.encoder
+    if isinstance(k, str):
+        return k
+    elif isinstance(k, float):
+        return json.dumps(k)
+    elif k is True:
+        return "true"
+    elif k is False:
+        return "false"
+    elif k is None:
+        return "null"
+    elif isinstance(k, int):
+        return int.__repr__(k)
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {k.__class__.__name__}"
+    )
+
+
+def _unified_diff(a, b, opcodes, *, fromfile: str, tofile: str, n: int):
+    # the same as difflib.unified_diff(a, b, lineterm=""), but with the opcodes
+    started = False
+    for group in _group_opcodes(opcodes, n):
+        if not started:
+            started = True
+            yield "--- {}".format(fromfile)
+            yield "+++ {}".format(tofile)
+
+        first, last = group[0], group[-1]
+        file1_range = _format_range_unified(first[1], last[2])
+        file2_range = _format_range_unified(first[3], last[4])
+        yield "@@ -{} +{} @@".format(file1_range, file2_range)
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in a[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in {"replace", "delete"}:
+                for line in a[i1:i2]:
+                    yield "-" + line
+            if tag in {"replace", "insert"}:
+                for line in b[j1:j2]:
+                    yield "+" + line
+
+
+def _group_opcodes(opcodes, n: int):
+    # the same as SequenceMatcher.get_grouped_opcodes()
+    codes = [tuple(code) for code in opcodes]
+    if not codes:
+        codes = [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    nn = n + n
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > nn:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _format_range_unified(start: int, stop: int) -> str:
+    # the same as difflib._format_range_unified()
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return "{}".format(beginning)
+    if not length:
+        beginning -= 1
+    return "{},{}".format(beginning, length)
+
+
 if __name__ == "__main__":
     import datetime
 
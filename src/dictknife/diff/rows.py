@@ -13,6 +13,7 @@ def diff_rows(
     diff_key: str = "diff",
     normalize: bool = False,
 ):
+    """Yields the rows of differences, the leaf values of both side (streaming)."""
     if normalize:
         d0 = sort_flexibly(d0)
         d1 = sort_flexibly(d1)
@@ -25,49 +26,61 @@ def diff_rows(
     if hasattr(d1, "__next__"):
         d1 = list(d1)
 
+    yield from _iterate_rows(
+        d0, d1, "", "", fromfile=fromfile, tofile=tofile, diff_key=diff_key
+    )
+
+
+def _iterate_rows(
+    d0, d1, prefix: str, name, *, fromfile: str, tofile: str, diff_key: str
+):
     if isinstance(d0, (list, tuple)) or isinstance(d1, (list, tuple)):
-        rows = []
         for i, (sd0, sd1) in enumerate(itertools.zip_longest(d0 or [], d1 or [])):
             if sd0 is None:
                 sd0 = sd1.__class__()
             elif sd1 is None:
                 sd1 = sd0.__class__()
-            subrows = diff_rows(
-                sd0, sd1, fromfile=fromfile, tofile=tofile, diff_key=diff_key
+            yield from _iterate_rows(
+                sd0,
+                sd1,
+                *_push(prefix, name, str(i)),
+                fromfile=fromfile,
+                tofile=tofile,
+                diff_key=diff_key,
             )
-            for srow in subrows:
-                srow["name"] = (
-                    "{}/{}".format(i, srow["name"]) if srow["name"] else str(i)
-                )
-            rows.extend(subrows)
-        return rows
     elif hasattr(d0, "keys") or hasattr(d1, "keys"):
         seen = set()
-        rows = []
         d0 = d0 or {}
         d1 = d1 or {}
         for k in _all_keys(list(d0.keys()), list(d1.keys())):
             if k in seen:
                 continue
             seen.add(k)
-            lv = d0.get(k)
-            rv = d1.get(k)
-            subrows = diff_rows(
-                lv, rv, fromfile=fromfile, tofile=tofile, diff_key=diff_key
+            yield from _iterate_rows(
+                d0.get(k),
+                d1.get(k),
+                *_push(prefix, name, k),
+                fromfile=fromfile,
+                tofile=tofile,
+                diff_key=diff_key,
             )
-            for srow in subrows:
-                srow["name"] = "{}/{}".format(k, srow["name"]) if srow["name"] else k
-            rows.extend(subrows)
-        return rows
     elif d0 is None or d1 is None:
-        return [{"name": "", fromfile: d0, tofile: d1, diff_key: None}]
+        yield {"name": name, fromfile: d0, tofile: d1, diff_key: None}
     elif isinstance(d0, (int, float)) and isinstance(d1, (int, float)):
-        return [{"name": "", fromfile: d0, tofile: d1, diff_key: d1 - d0}]
+        yield {"name": name, fromfile: d0, tofile: d1, diff_key: d1 - d0}
     else:  # str
         lvs = str(d0)
         rvs = str(d1)
         diff_value = "" if lvs == rvs else "".join(difflib.ndiff(lvs, rvs))
-        return [{"name": "", fromfile: d0, tofile: d1, diff_key: diff_value}]
+        yield {"name": name, fromfile: d0, tofile: d1, diff_key: diff_value}
+
+
+def _push(prefix: str, name, k):
+    # returns the (prefix, name) of the child, built once per level.
+    # e.g. ["a", "0", "b"] -> "a/0/b" (the empty names at the tail are skipped)
+    if not prefix:  # root
+        return "{}/".format(k), k
+    return "{}{}/".format(prefix, k), ("{}{}".format(prefix, k) if k else name)
 
 
 def _all_keys(xs, ys):
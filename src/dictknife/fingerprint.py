@@ -0,0 +1,106 @@
+import hashlib
+
+# fingerprint (content hash)
+# ----------------------------------------
+#
+# - the fingerprint of a container is computed from the fingerprints of its children
+#   (merkle tree), so the fingerprint of each subtree is computed only once
+# - if x == y (or deepequal(x, y)), then fingerprint(x) == fingerprint(y)
+#   - the order of the keys of dict is ignored
+#   - list and tuple are treated as the same
+#   - 1, 1.0 and True are treated as the same
+# - stable across processes for json-like values (dict, list, tuple, str, int,
+#   float, bool and None). the other objects are hashed with hash() (only stable
+#   in the process), or with their type if unhashable
+# - if unordered is True, the order of the elements of list is also ignored
+#   (the same as deepequal(x, y, normalize=True))
+
+
+def fingerprint(d) -> str:
+    """Returns the fingerprint (content hash) of the value, as hex string."""
+    return Fingerprinter().hexdigest(d)
+
+
+class Fingerprinter:
+    """Computes the fingerprints, the containers' ones are cached by id.
+
+    The cache is valid while the containers are not modified (if modified,
+    call forget() or use a new instance).
+    """
+
+    digest_size = 16
+
+    def __init__(self, *, unordered: bool = False) -> None:
+        self.unordered = unordered
+        self.cache: dict[int, tuple[object, bytes]] = {}  # id -> (container, digest)
+
+    def hexdigest(self, d) -> str:
+        return self.digest(d).hex()
+
+    def digest(self, d) -> bytes:
+        if hasattr(d, "keys") or isinstance(d, (list, tuple, set, frozenset)):
+            return self._digest_container(d)
+        return hashlib.blake2b(self._encode(d), digest_size=self.digest_size).digest()
+
+    def forget(self, d) -> None:
+        self.cache.pop(id(d), None)
+
+    def _digest_container(self, d) -> bytes:
+        k = id(d)
+        cached = self.cache.get(k)
+        if cached is not None and cached[0] is d:
+            return cached[1]
+
+        encode = self._encode
+        if hasattr(d, "keys"):
+            h = hashlib.blake2b(b"d", digest_size=self.digest_size)
+            h.update(b"".join(sorted([encode(k) + encode(v) for k, v in d.items()])))
+        elif isinstance(d, (list, tuple)):
+            h = hashlib.blake2b(b"l", digest_size=self.digest_size)
+            if self.unordered:
+                h.update(b"".join(sorted([encode(x) for x in d])))
+            else:
+                h.update(b"".join([encode(x) for x in d]))
+        else:
+            h = hashlib.blake2b(b"S", digest_size=self.digest_size)
+            for ex in sorted([encode(x) for x in d]):
+                h.update(ex)
+
+        digest = h.digest()
+        self.cache[k] = (d, digest)
+        return digest
+
+    def _encode(self, x) -> bytes:
+        # each encoded value is self-delimiting
+        cls = x.__class__
+        if cls is str:
+            b = x.encode("utf-8", "surrogatepass")
+            return b"s%d:%s" % (len(b), b)
+        elif cls is int or cls is bool:
+            return b"i%d;" % x
+        elif x is None:
+            return b"n"
+        elif cls is float:
+            return _encode_float(x)
+        elif hasattr(x, "keys") or isinstance(x, (list, tuple, set, frozenset)):
+            return b"h" + self._digest_container(x)
+        elif isinstance(x, str):
+            return self._encode(str.__str__(x))
+        elif isinstance(x, int):
+            return b"i%d;" % x
+        elif isinstance(x, float):
+            return _encode_float(x)
+        elif isinstance(x, (bytes, bytearray)):
+            return b"b%d:%s" % (len(x), x)
+
+        name = "{}.{}".format(cls.__module__, cls.__qualname__).encode("utf-8")
+        try:
+            return b"o%d:%s%d;" % (len(name), name, hash(x))
+        except TypeError:  # unhashable
+            return b"u%d:%s" % (len(name), name)
+
+
+def _encode_float(x: float) -> bytes:
+    if x.is_integer():  # 1.0 == 1
+        return b"i%d;" % int(x)
+    return b"f%s;" % repr(float(x)).encode("ascii")
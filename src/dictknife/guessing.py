@@ -1,7 +1,35 @@
 import re
+from functools import lru_cache
 from .langhelpers import reify
 from .accessing import get_modifier
 
+# the patterns are disjoint by the first character of the value
+_is_bool = re.compile(r"[Tt]rue|[Ff]alse").match
+_is_float = re.compile(r"-?(?:\d*\.\d+(?:e-\d+)?|nan|inf)$").match
+_is_int = re.compile(r"-?(?:0|[1-9]\d*)$").match
+# is_int or is_float, in a single match (lastindex: 1 is int, 2 is float)
+_is_number = re.compile(
+    r"(?:(-?(?:0|[1-9]\d*))|(-?(?:\d*\.\d+(?:e-\d+)?|nan|inf)))$"
+).match
+
+# the first characters of the values, that is_bool (or is_int, is_float) can match
+_BOOL_HEADS = frozenset("TtFf")
+_NUMBER_HEADS = frozenset("-.0123456789ni")
+
+
+@lru_cache(maxsize=1024)
+def _guess_str(v: str):
+    # same as Guesser().guess(v), for str (the values like "true", "0" are repeated)
+    head = v[:1]
+    if head in _BOOL_HEADS:
+        if _is_bool(v):
+            return v.lower() == "true"
+    elif head in _NUMBER_HEADS or head.isdecimal():  # \d matches non-ascii digits
+        m = _is_number(v)
+        if m is not None:
+            return int(v) if m.lastindex == 1 else float(v)
+    return v
+
 
 class Guesser:
     def __init__(self, modifier, default=None) -> None:
@@ -10,15 +38,15 @@ class Guesser:
 
     @reify
     def is_bool(self):
-        return re.compile(r"[Tt]rue|[Ff]alse").match
+        return _is_bool
 
     @reify
     def is_float(self):
-        return re.compile(r"-?(?:\d*\.\d+(?:e-\d+)?|nan|inf)$").match
+        return _is_float
 
     @reify
     def is_int(self):
-        return re.compile(r"-?(?:0|[1-9]\d*)$").match
+        return _is_int
 
     def is_list(self, v):
         return isinstance(v, (list, tuple))
@@ -27,7 +55,9 @@ class Guesser:
         return hasattr(v, "keys")
 
     def guess(self, v):
-        if self.is_list(v):
+        if v.__class__ is str:  # fast path
+            return self.guess_str(v)
+        elif self.is_list(v):
             return self.modifier.modify_list(self.guess, v)
         elif self.is_dict(v):
             return self.modifier.modify_dict(self.guess, v)
@@ -42,11 +72,132 @@ class Guesser:
         else:
             return self.default(v)
 
+    @reify
+    def guess_str(self):
+        cls = self.__class__
+        if (
+            cls.is_bool is Guesser.is_bool
+            and cls.is_int is Guesser.is_int
+            and cls.is_float is Guesser.is_float
+            and getattr(self.default, "__func__", None) is Guesser.guess_default
+        ):
+            return _guess_str  # cached
+        return self._guess_str
+
+    def _guess_str(self, v):
+        if self.is_bool(v):
+            return v.lower() == "true"
+        elif self.is_int(v):
+            return int(v)
+        elif self.is_float(v):
+            return float(v)
+        else:
+            return self.default(v)
+
     def guess_default(self, v):
         return v
 
 
+_guessers: dict[bool, Guesser] = {}  # mutable -> guesser, reused
+
+
 def guess(d, *, guesser_factory=Guesser, default=None, mutable: bool = False):
+    if guesser_factory is Guesser and default is None:
+        g = _guessers.get(mutable)
+        if g is None:
+            g = _guessers[mutable] = Guesser(get_modifier(mutable=mutable))
+        return g.guess(d)
     modifier = get_modifier(mutable=mutable)
     g = guesser_factory(modifier, default=default)
     return g.guess(d)
+
+
+class ColumnGuesser:
+    """Guesses the values of the rows (e.g. csv), column by column.
+
+    The kinds of the values in the first `sample_size` rows are recorded, and
+    after that, each column is converted by the converter of its kind (a
+    single regex match per cell). If the value doesn't match, it falls back
+    to Guesser.guess(), so the result is the same as guess(row).
+    """
+
+    _maybe_not_str = _BOOL_HEADS | _NUMBER_HEADS
+
+    def __init__(self, *, sample_size: int = 10, guesser=None) -> None:
+        self.sample_size = sample_size
+        self.guesser = guesser or Guesser(get_modifier(mutable=True))
+        self.kinds: dict[str, set] = {}  # column -> kinds of the sampled values
+        self.converters = None  # column -> converter, fixed after sampling
+        self.n = 0
+
+    def guess(self, row):
+        """Guesses the values of the row (dict), in place."""
+        converters = self.converters
+        if converters is None:
+            return self._sample(row)
+
+        fallback = self.guesser.guess
+        for k, v in row.items():
+            convert = converters.get(k)
+            row[k] = fallback(v) if convert is None else convert(v)
+        return row
+
+    def _sample(self, row):
+        guess = self.guesser.guess
+        kinds = self.kinds
+        for k, v in row.items():
+            row[k] = guessed = guess(v)
+            if hasattr(v, "strip"):
+                kinds.setdefault(k, set()).add(guessed.__class__)
+
+        self.n += 1
+        if self.n >= self.sample_size:
+            self.converters = {
+                k: self._make_converter(next(iter(xs)))
+                for k, xs in kinds.items()
+                if len(xs) == 1
+            }
+        return row
+
+    def _make_converter(self, kind):
+        g = self.guesser
+        fallback = g.guess
+
+        # the patterns of is_bool, is_int and is_float are disjoint
+        # (by the first character), so the order of the checks is not needed
+        if kind is bool:
+            is_bool = g.is_bool
+
+            def convert(v):
+                if v.__class__ is str and is_bool(v):
+                    return v.lower() == "true"
+                return fallback(v)
+
+        elif kind is int:
+            is_int = g.is_int
+
+            def convert(v):
+                if v.__class__ is str and is_int(v):
+                    return int(v)
+                return fallback(v)
+
+        elif kind is float:
+            is_float = g.is_float
+
+            def convert(v):
+                if v.__class__ is str and is_float(v):
+                    return float(v)
+                return fallback(v)
+
+        else:
+            maybe_not_str = self._maybe_not_str
+            default = g.default
+
+            def convert(v):
+                if v.__class__ is str:
+                    head = v[:1]
+                    if head not in maybe_not_str and not head.isdecimal():
+                        return default(v)
+                return fallback(v)
+
+        return convert
@@ -1,8 +1,10 @@
 from .expander import Expander  # noqa
 from .bundler import Bundler, create_scanner_factory_from_flavor  # noqa
 from .separator import Separator  # noqa
+from .refgraph import RefGraph  # noqa
 from .resolver import (  # noqa
     get_resolver,
+    Prefetcher,
     get_resolver_from_filename,  # backward compatibility
 )
 from .example import extract as extract_example  # noqa
@@ -16,8 +18,10 @@ from ..langhelpers import make_dict, pairrsplit
 import os.path
 
 
-def expand(filename, *, onload=None, doc=None, format=None):
-    resolver = get_resolver(filename, doc=doc, onload=onload, format=format)
+def expand(filename, *, onload=None, doc=None, format=None, prefetcher=None):
+    resolver = get_resolver(
+        filename, doc=doc, onload=onload, format=format, prefetcher=prefetcher
+    )
     expander = Expander(resolver)
     return expander.expand()
 
@@ -30,6 +34,7 @@ def bundle(
     format=None,
     extras=None,
     flavor: str = "openapiv2",
+    prefetcher=None,
 ):
     jsonref = ""
     if filename:
@@ -60,7 +65,9 @@ def bundle(
                 )
             assign_by_json_pointer(doc, ejsonref, {"$ref": eref})
 
-    resolver = get_resolver(filename, doc=doc, onload=onload, format=format)
+    resolver = get_resolver(
+        filename, doc=doc, onload=onload, format=format, prefetcher=prefetcher
+    )
     bundler = Bundler(
         resolver, scanner_factory=create_scanner_factory_from_flavor(flavor)
     )
@@ -2,7 +2,7 @@ import logging
 import os.path
 from collections import defaultdict
 from functools import partial
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Optional, cast
 
 from dictknife.langhelpers import make_dict, titleize, reify, pairrsplit
 from dictknife import DictWalker
@@ -12,6 +12,7 @@ from dictknife import deepmerge
 from .relpath import relpath
 from .accessor import CachedItemAccessor
 from .accessor import is_ref
+from .refgraph import RefGraph
 
 if TYPE_CHECKING:
     from .accessor import CachedItem
@@ -45,6 +46,7 @@ class Bundler:
         self.item_map: dict[str, "CachedItem"] = make_dict()  # localref -> item
         self.strict = strict
         self._scanner_factory = scanner_factory or Scanner
+        self.graph = None
 
     @reify
     def scanner(self):
@@ -56,6 +58,13 @@ class Bundler:
 
     def bundle(self, doc=None):
         doc = doc or self.resolver.doc
+
+        # the documents are walked only once, the scanner and the emitter share the result.
+        # each file is indexed when it is reached (the files are loaded lazily, as needed)
+        self.graph = RefGraph()
+        self.graph.index(self.resolver, doc=doc)
+        self.scanner.graph = self.emitter.graph = self.graph
+
         conflicted = self.scanner.scan(doc)
         return self.emitter.emit(self.resolver, doc, conflicted=conflicted)
 
@@ -68,6 +77,7 @@ class Scanner:
         self.item_map = item_map
         self.strict = strict
         self.seen: set[str] = set()
+        self.graph: Optional[RefGraph] = None
 
         # todo: rename
         self.localref_fixer = localref_fixer or LocalrefFixer(
@@ -78,6 +88,9 @@ class Scanner:
     def ref_walking(self):
         return DictWalker([is_ref])
 
+    def iterate_refs(self, doc, *, resolver=None):
+        return _iterate_refs(self.graph, self.ref_walking, doc, resolver=resolver)
+
     @reify
     def conflict_fixer(self):  # todo: rename
         return SimpleConflictFixer(self.item_map, strict=self.strict)
@@ -110,8 +123,8 @@ class Scanner:
                 self.accessor.pop_stack()
         assert len(self.accessor.stack) == 1
 
-    def _scan_refs(self, doc, *, conflicted) -> None:
-        for path, sd in self.ref_walking.iterate(doc):
+    def _scan_refs(self, doc, *, conflicted, resolver=None) -> None:
+        for path, sd in self.iterate_refs(doc, resolver=resolver):
             try:
                 item = self.accessor.access(sd["$ref"])
                 if item in self.seen:
@@ -126,7 +139,9 @@ class Scanner:
                         and item.data["$ref"].endswith(sd["$ref"])
                     ):
                         self.item_map[item.localref] = item
-                    self._scan_refs(doc=item.data, conflicted=conflicted)
+                    self._scan_refs(
+                        doc=item.data, conflicted=conflicted, resolver=item.resolver
+                    )
                 if item.globalref != self.item_map[item.localref].globalref:
                     newitem = self.conflict_fixer.fix_conflict(
                         self.item_map[item.localref], item
@@ -134,7 +149,11 @@ class Scanner:
                     if newitem is None:
                         continue
                     conflicted[sd["$ref"]].append(newitem)
-                    self._scan_refs(doc=newitem.data, conflicted=conflicted)
+                    self._scan_refs(
+                        doc=newitem.data,
+                        conflicted=conflicted,
+                        resolver=newitem.resolver,
+                    )
             finally:
                 self.accessor.pop_stack()
 
@@ -144,11 +163,15 @@ class Emitter:
         self.raw_accessor = Accessor()
         self.accessor = accessor
         self.item_map = item_map
+        self.graph: Optional[RefGraph] = None
 
     @reify
     def ref_walking(self):
         return DictWalker([is_ref])
 
+    def iterate_refs(self, doc, *, resolver=None):
+        return _iterate_refs(self.graph, self.ref_walking, doc, resolver=resolver)
+
     def get_item_by_globalref(self, globalref):
         return self.accessor.cache[globalref]
 
@@ -158,7 +181,7 @@ class Emitter:
     def emit(self, resolver, doc, *, conflicted):
         # side effect
         d: dict[str, object] = make_dict()
-        for path, sd in self.ref_walking.iterate(doc):
+        for path, sd in self.iterate_refs(doc):
             self.replace_ref(resolver, sd)
 
         d = deepmerge(d, doc)
@@ -167,7 +190,7 @@ class Emitter:
                 continue
             data = item.data
             # replace: <file.yaml>#/<ref> -> #/<ref>
-            for path, sd in self.ref_walking.iterate(data):
+            for path, sd in self.iterate_refs(data, resolver=item.resolver):
                 if not sd["$ref"].startswith("#/"):
                     self.replace_ref(item.resolver, sd)
                 if sd["$ref"] in conflicted:
@@ -197,6 +220,17 @@ class Emitter:
             sd["$ref"] = new_ref
 
 
+def _iterate_refs(
+    graph: Optional[RefGraph], ref_walking: DictWalker, doc, *, resolver=None
+):
+    if graph is not None and resolver is not None:
+        graph.index(resolver)  # the document of the resolver is already loaded
+    itr = graph.iterate_in(doc) if graph is not None else None
+    if itr is None:  # not indexed
+        return ref_walking.iterate(doc)
+    return itr
+
+
 class LocalrefFixer:  # todo: rename
     def __init__(self, *, default_position: str) -> None:
         self.default_position = default_position
@@ -19,11 +19,39 @@ def detect_circur_reference(doc, d) -> bool:
     return False
 
 
+def _collect_reachable_ids(d) -> set[int]:
+    # same as detect_circur_reference(), but each shared node is visited once
+    seen = {id(d)}
+    stack = [d]
+    while stack:
+        d = stack.pop()
+        if isinstance(d, dict):
+            children = d.values()
+        elif isinstance(d, list):
+            children = d
+        else:
+            continue
+        for x in children:
+            if isinstance(x, (dict, list)) and id(x) not in seen:
+                seen.add(id(x))
+                stack.append(x)
+    return seen
+
+
 class Expander(object):
     def __init__(self, resolver) -> None:
         self.accessor = StackedAccessor(resolver)
         self.resolver = resolver
 
+        # id(target) -> target, the targets that are already expanded (memo)
+        self._expanded = {}
+        # id(target) -> ids of reachable nodes, for the circular reference detection
+        self._reachable = {}
+        # ids of the targets being expanded (resolution stack)
+        self._expanding = set()
+        # ids of the nodes already walked
+        self._walked = set()
+
     @reify
     def ref_walking(self):
         return DictWalker(["$ref"])
@@ -44,16 +72,70 @@ class Expander(object):
         if "$ref" in subpart:
             original = self.accessor.access(subpart["$ref"])
             ref = subpart.pop("$ref")
-            new_subpart = self.expand_subpart(
-                original, resolver=self.accessor.resolver, ctx=ctx
-            )
-            if detect_circur_reference(subpart, new_subpart):
-                subpart["$ref"] = ref
+            if id(original) in self._expanding:
+                subpart["$ref"] = ref  # circular reference (on the resolution stack)
             else:
-                subpart.update(new_subpart)
+                new_subpart = self._expand_target(original, ctx=ctx)
+                if self._is_reachable(subpart, new_subpart):
+                    subpart["$ref"] = ref
+                else:
+                    subpart.update(new_subpart)
+                    self._invalidate(subpart)
             self.accessor.pop_stack()
             return subpart
         else:
-            for path, sd in self.ref_walking.iterate(subpart):
-                self.expand_subpart(sd, resolver=resolver, ctx=ctx)
+            self._expand_children(subpart, resolver=resolver, ctx=ctx)
             return subpart
+
+    def _expand_children(self, d, *, resolver, ctx) -> None:
+        # same order as self.ref_walking, but the shared nodes are walked only once
+        if hasattr(d, "keys"):
+            children = list(d.keys())
+        elif isinstance(d, (list, tuple)):
+            children = range(len(d))
+        else:
+            return
+
+        k = id(d)
+        if k in self._walked:
+            return
+        for name in children:
+            if name == "$ref" and hasattr(d, "keys"):
+                self.expand_subpart(d, resolver=resolver, ctx=ctx)
+            else:
+                self._expand_children(d[name], resolver=resolver, ctx=ctx)
+        self._walked.add(k)
+
+    def _expand_target(self, target, *, ctx=None):
+        k = id(target)
+        if k in self._expanded:
+            return target
+
+        self._expanding.add(k)
+        try:
+            resolver = self.accessor.resolver
+            has_ref = "$ref" in target
+            self.expand_subpart(target, resolver=resolver, ctx=ctx)
+            if has_ref:  # the values next to the $ref are not expanded, yet
+                for name in list(target.keys()):
+                    if name != "$ref":
+                        self._expand_children(target[name], resolver=resolver, ctx=ctx)
+        finally:
+            self._expanding.remove(k)
+        self._expanded[k] = target
+        return target
+
+    def _is_reachable(self, subpart, target) -> bool:
+        k = id(target)
+        ids = self._reachable.get(k)
+        if ids is None:
+            ids = self._reachable[k] = _collect_reachable_ids(target)
+        return id(subpart) in ids
+
+    def _invalidate(self, subpart) -> None:
+        # subpart has new children, so the reachable nodes are changed
+        k = id(subpart)
+        for target_id in [
+            target_id for target_id, ids in self._reachable.items() if k in ids
+        ]:
+            del self._reachable[target_id]
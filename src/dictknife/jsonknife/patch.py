@@ -1,7 +1,23 @@
-from collections import namedtuple
+import json
+from collections import deque, namedtuple
+from difflib import SequenceMatcher
+
+from dictknife.fingerprint import Fingerprinter
+from dictknife.langhelpers import as_path_node
 
 diff = namedtuple("diff", "op, value, x_from, x_to")
 
+# json patch
+# ----------------------------------------
+#
+# - the operations are applied sequentially (RFC 6902), so the indices of
+#   a list are the ones at the time of each operation
+# - the elements of list are aligned by their contents (not positionally),
+#   so inserting an element produces a single `add`. the common prefix and
+#   suffix are skipped, and the others are hashed as compact json (or fingerprint)
+# - the removed value found in the same container is `move`d, and the added
+#   value (dict or list) equal to another one in the same container is `copy`ed
+
 
 def make_jsonpatch(src, dst, *, verbose: bool = False):
     # iterator?
@@ -10,8 +26,7 @@ def make_jsonpatch(src, dst, *, verbose: bool = False):
     if hasattr(dst, "__next__"):
         dst = list(dst)
 
-    r = _Walker().walk(src, dst)
-    rows = _merge(r)
+    rows = _Walker().walk(src, dst)
 
     if not verbose:
         for row in rows:
@@ -38,71 +53,431 @@ def make_jsonpatch(src, dst, *, verbose: bool = False):
             yield row
 
 
-def _merge(r):
-    if r is None:
-        return []
-    if not hasattr(r, "keys"):
-        yield {"path": "", **r._asdict()}
-    else:
-        for k, v in r.items():
-            prefix = str(k).replace("~", "~0").replace("/", "~1")
-            for sv in _merge(v):
-                sv["path"] = "/{prefix}/{subpath}".format(
-                    prefix=prefix, subpath=sv["path"].lstrip("/")
-                ).rstrip("/")
-                yield sv
+def _join(path: str, k) -> str:
+    return "{}/{}".format(path, str(k).replace("~", "~0").replace("/", "~1"))
+
+
+def _row(op: str, path: str, *, value=None, x_from=None, x_to=None) -> dict:
+    return {
+        "path": path,
+        **diff(op=op, value=value, x_from=x_from, x_to=x_to)._asdict(),
+    }
+
+
+def _is_container(x) -> bool:
+    return hasattr(x, "keys") or isinstance(x, (list, tuple))
 
 
 class _Walker:
-    # two path scan move, copy
     def __init__(self) -> None:
-        self.move_map: dict = {}  # todo:
+        self.fingerprinter = Fingerprinter()
+        self._encode = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+
+    def _key(self, x):
+        # atoms are compared by themselves (the same as _walk_atom)
+        if _is_container(x):
+            try:
+                return ("j", self._encode(x))
+            except (TypeError, ValueError):
+                return ("h", self.fingerprinter.digest(x))
+        elif isinstance(x, (set, frozenset)):
+            return ("h", self.fingerprinter.digest(x))
+        return x
 
-    def walk(self, src, dst):
+    def walk(self, src, dst, path: str = ""):
         # xxx: src and dst is None
         if hasattr(src, "keys"):
-            return self._walk_dict(src, dst)
+            if hasattr(dst, "keys"):
+                return self._walk_dict(src, dst, path)
         elif isinstance(src, (list, tuple)):
-            return self._walk_list(src, dst)
+            if isinstance(dst, (list, tuple)):
+                return self._walk_list(src, dst, path)
         else:
-            return self._walk_atom(src, dst)
+            return self._walk_atom(src, dst, path)
+        return [_row("replace", path, value=dst, x_from=src, x_to=dst)]
 
-    def _walk_list(self, src, dst):
-        r = {}
-        try:
-            n = min(len(src), len(dst))
-        except TypeError:
-            return diff(op="replace", value=dst, x_from=src, x_to=dst)
-        for i in range(n):
-            r[str(i)] = self.walk(src[i], dst[i])
-
-        if n == len(dst):
-            for i in range(n, len(src)):
-                r[str(i)] = diff(op="remove", value=None, x_from=src[i], x_to=None)
-        else:
-            for i in range(n, len(dst)):
-                r[str(i)] = diff(op="add", value=dst[i], x_from=None, x_to=dst[i])
-        return r
+    def _walk_item(self, src, dst, path: str):
+        # "add" and "remove" of the element of list shift the others
+        if src is None or dst is None:
+            return [_row("replace", path, value=dst, x_from=src, x_to=dst)]
+        return self.walk(src, dst, path)
+
+    def _walk_list(self, src, dst, path: str):
+        key = self._key
+        n, m = len(src), len(dst)
+        lo = 0  # common prefix
+        while lo < n and lo < m and src[lo] == dst[lo]:
+            lo += 1
+        if lo == n == m:
+            return
+        hi = 0  # common suffix
+        while hi < n - lo and hi < m - lo and src[n - 1 - hi] == dst[m - 1 - hi]:
+            hi += 1
+        src_end, dst_end = n - hi, m - hi
+        xs = [key(x) for x in src[lo:src_end]]
+        ys = [key(y) for y in dst[lo:dst_end]]
 
-    def _walk_dict(self, src, dst):
-        r = {}
+        # alignment, tokens[j] is the index of src placed at dst[j] (None: new one)
+        tokens = [None] * m
+        tokens[:lo] = range(lo)
+        tokens[dst_end:] = range(src_end, n)
+        fixed = set(range(lo)) | set(range(dst_end, m))  # indices of dst, not moved
+        deleted = []
+        inserted = []
+        matcher = SequenceMatcher(None, xs, ys, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            i1, i2, j1, j2 = i1 + lo, i2 + lo, j1 + lo, j2 + lo
+            if tag == "equal":
+                tokens[j1:j2] = range(i1, i2)
+                fixed.update(range(j1, j2))
+                continue
+            size = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+            for i, j in zip(range(i1, i1 + size), range(j1, j1 + size)):
+                # modified in place, before shifting the indices
+                tokens[j] = i
+                fixed.add(j)
+                yield from self._walk_item(src[i], dst[j], _join(path, i))
+            deleted.extend(range(i1 + size, i2))
+            inserted.extend(range(j1 + size, j2))
+
+        pool: dict = {}
+        for j in inserted:
+            pool.setdefault(ys[j - lo], deque()).append(j)
+        removed = []
+        for i in deleted:
+            q = pool.get(xs[i - lo])
+            if q:
+                tokens[q.popleft()] = i  # move
+            else:
+                removed.append(i)
+        for i in reversed(removed):
+            yield _row("remove", _join(path, i), x_from=src[i])
+        if not inserted:
+            return
+
+        sources = None  # key -> token, copy sources (only in the aligned range)
+
+        # tokens are placed in order, just after the previous one
+        gone = set(removed)
+        current = [i for i in range(n) if i not in gone]
+        for j, t in enumerate(tokens):
+            if j in fixed:
+                continue
+            if t is None:
+                t = -(j + 1)
+                pos = current.index(tokens[j - 1]) + 1 if j > 0 else 0
+                v = dst[j]
+                source = None
+                if _is_container(v) and len(v) > 0:
+                    if sources is None:
+                        sources = {}
+                        for k, y in enumerate(ys, lo):
+                            if tokens[k] is not None and _is_container(dst[k]):
+                                sources.setdefault(y, tokens[k])
+                    source = sources.setdefault(ys[j - lo], t)
+                if source is not None and source != t:
+                    from_path = _join(path, current.index(source))
+                    yield {"path": _join(path, pos), "op": "copy", "from": from_path}
+                else:
+                    yield _row("add", _join(path, pos), value=v, x_to=v)
+                tokens[j] = t
+                current.insert(pos, t)
+            else:
+                k = current.index(t)
+                current.pop(k)
+                pos = current.index(tokens[j - 1]) + 1 if j > 0 else 0
+                current.insert(pos, t)
+                if k != pos:
+                    yield {
+                        "path": _join(path, pos),
+                        "op": "move",
+                        "from": _join(path, k),
+                    }
+
+    def _walk_dict(self, src, dst, path: str):
+        key = self._key
+        added = [k for k in dst if k not in src]
+        pool: dict = {}  # key -> added names, for move
+        for k in added:
+            v = dst[k]
+            if _is_container(v) and len(v) > 0:
+                pool.setdefault(key(v), deque()).append(k)
+
+        moved = {}  # added name -> removed name
         for k, v in src.items():
             if k in dst:
-                r[k] = self.walk(v, dst[k])
+                yield from self.walk(v, dst[k], _join(path, k))
+                continue
+            q = pool.get(key(v)) if pool and _is_container(v) else None
+            if q:
+                moved[q.popleft()] = k
             else:
-                r[k] = diff("remove", value=None, x_from=v, x_to=None)
-        for k, v in dst.items():
-            if k in r:
+                yield _row("remove", _join(path, k), x_from=v)
+
+        sources = None  # key -> name, for copy
+        for k in added:
+            v = dst[k]
+            if k in moved:
+                yield {
+                    "path": _join(path, k),
+                    "op": "move",
+                    "from": _join(path, moved[k]),
+                }
                 continue
-            r[k] = diff("add", value=v, x_from=None, x_to=v)
-        return r
+            if _is_container(v) and len(v) > 0:
+                if sources is None:
+                    sources = {}
+                    for name, sv in dst.items():
+                        if name in src and _is_container(sv) and len(sv) > 0:
+                            sources.setdefault(key(sv), name)
+                name = sources.get(key(v))
+                if name is not None:
+                    yield {
+                        "path": _join(path, k),
+                        "op": "copy",
+                        "from": _join(path, name),
+                    }
+                    continue
+                sources[key(v)] = k
+            yield _row("add", _join(path, k), value=v, x_to=v)
 
-    def _walk_atom(self, src, dst):
+    def _walk_atom(self, src, dst, path: str):
         if src is None:
-            return diff(op="add", value=dst, x_from=None, x_to=dst)
+            if dst is not None:
+                yield _row("add", path, value=dst, x_to=dst)
         elif dst is None:
-            return diff(op="remove", value=None, x_from=src, x_to=None)
+            yield _row("remove", path, x_from=src)
         elif src != dst:
-            return diff(op="replace", value=dst, x_from=src, x_to=dst)
+            yield _row("replace", path, value=dst, x_from=src, x_to=dst)
+
+
+def apply_patch(doc, ops, *, inplace: bool = False):
+    """Applies the json patch (RFC 6902), and returns the patched document.
+
+    If inplace is False, the document is not modified, and only the containers
+    on the modified paths are copied. If inplace is True, the document is
+    modified (partially, on error).
+    """
+    patcher = _Patcher(doc, inplace=inplace)
+    for op in ops:
+        patcher.apply(op)
+    return patcher.doc
+
+
+class _Patcher:
+    # - each pointer is compiled once
+    # - the containers to the parent of the last path are kept (chain), so
+    #   the operations sharing a prefix don't traverse it again
+    # - copy-on-write, the containers not owned are copied before modified.
+    #   the values in the operations (and copied ones) are never modified
+
+    def __init__(self, doc, *, inplace: bool = False) -> None:
+        self.doc = doc
+        self.inplace = inplace
+        self.owned: dict = {}  # id -> container, copied by this patcher
+        self.shared: dict = {}  # id -> container, referenced from the others
+        self.pointers: dict = {}  # pointer -> tokens
+        self.chain = [doc]  # containers, from the root to the parent of the last path
+        self.chain_tokens: tuple = ()
+        self.writable_size = 0  # chain[:writable_size] are writable
+
+    def apply(self, op) -> None:
+        try:
+            name = op["op"]
+            tokens = self.compile(op["path"])
+        except (KeyError, TypeError):
+            raise ValueError("invalid operation: {!r}".format(op)) from None
+
+        if name == "add":
+            self._share(op["value"])
+            self._add(tokens, op["value"])
+        elif name == "remove":
+            self._remove(tokens)
+        elif name == "replace":
+            self._share(op["value"])
+            self._replace(tokens, op["value"])
+        elif name == "move":
+            from_tokens = self.compile(op["from"])
+            if tokens == from_tokens:
+                self._get(tokens)
+            elif tokens[: len(from_tokens)] == from_tokens:
+                raise ValueError("cannot move into its child: {!r}".format(op))
+            else:
+                self._add(tokens, self._remove(from_tokens))
+        elif name == "copy":
+            value = self._get(self.compile(op["from"]))
+            self._share(value)
+            self._add(tokens, value)
+        elif name == "test":
+            if not _equal(self._get(tokens), op["value"]):
+                raise ValueError("test failed: {!r}".format(op))
+        else:
+            raise ValueError("invalid operation: {!r}".format(op))
+
+    def compile(self, pointer: str) -> tuple:
+        tokens = self.pointers.get(pointer)
+        if tokens is None:
+            if pointer and not pointer.startswith("/"):
+                raise ValueError("invalid json pointer: {!r}".format(pointer))
+            tokens = pointer.split("/")[1:]
+            if "~" in pointer:
+                tokens = [as_path_node(x) for x in tokens]
+            tokens = self.pointers[pointer] = tuple(tokens)
+        return tokens
+
+    def _add(self, tokens: tuple, value) -> None:
+        if not tokens:
+            self._set_root(value)
+            return
+        d = self._parent(tokens, writable=True)
+        if hasattr(d, "keys"):
+            d[tokens[-1]] = value
+        else:
+            d.insert(self._index(d, tokens, allow_end=True), value)
+
+    def _remove(self, tokens: tuple):
+        if not tokens:
+            raise ValueError("cannot remove the root")
+        d = self._parent(tokens, writable=True)
+        if hasattr(d, "keys"):
+            if tokens[-1] not in d:
+                raise KeyError(_to_pointer(tokens))
+            return d.pop(tokens[-1])
+        return d.pop(self._index(d, tokens))
+
+    def _replace(self, tokens: tuple, value) -> None:
+        if not tokens:
+            self._set_root(value)
+            return
+        d = self._parent(tokens, writable=True)
+        if hasattr(d, "keys"):
+            if tokens[-1] not in d:
+                raise KeyError(_to_pointer(tokens))
+            d[tokens[-1]] = value
+        else:
+            d[self._index(d, tokens)] = value
+
+    def _get(self, tokens: tuple):
+        if not tokens:
+            return self.doc
+        return self._child(self._parent(tokens), tokens, len(tokens) - 1)
+
+    def _set_root(self, value) -> None:
+        self.doc = value
+        self.chain = [value]
+        self.chain_tokens = ()
+        self.writable_size = 0
+
+    def _parent(self, tokens: tuple, *, writable: bool = False):
+        n = len(tokens) - 1
+        chain = self.chain
+        ctokens = self.chain_tokens
+        if ctokens != tokens[:n]:
+            common = 0  # the length of the common prefix
+            size = min(n, len(ctokens))
+            while common < size and ctokens[common] == tokens[common]:
+                common += 1
+            while len(chain) > common + 1:
+                chain.pop()
+            self.writable_size = min(self.writable_size, len(chain))
+            d = chain[-1]
+            for j in range(common, n):
+                d = self._child(d, tokens, j)
+                chain.append(d)
+            self.chain_tokens = tokens[:n]
+        d = chain[-1]
+        if not _is_container(d):
+            raise KeyError(_to_pointer(tokens))
+
+        if writable and self.writable_size < len(chain):
+            for j in range(self.writable_size, len(chain)):
+                x = chain[j]
+                if self._is_writable(x):
+                    continue
+                x = chain[j] = self._copy(x)
+                if j == 0:
+                    self.doc = x
+                else:
+                    parent = chain[j - 1]
+                    if hasattr(parent, "keys"):
+                        parent[tokens[j - 1]] = x
+                    else:
+                        parent[int(tokens[j - 1])] = x
+            self.writable_size = len(chain)
+            d = chain[-1]
+        return d
+
+    def _child(self, d, tokens: tuple, j: int):
+        if hasattr(d, "keys"):
+            try:
+                return d[tokens[j]]
+            except KeyError:
+                raise KeyError(_to_pointer(tokens[: j + 1])) from None
+        elif isinstance(d, (list, tuple)):
+            return d[self._index(d, tokens[: j + 1])]
+        raise KeyError(_to_pointer(tokens[: j + 1]))
+
+    def _index(self, seq, tokens: tuple, *, allow_end: bool = False) -> int:
+        token = tokens[-1]
+        if token == "-" and allow_end:
+            return len(seq)
+        if not (token.isascii() and token.isdigit()) or (
+            len(token) > 1 and token.startswith("0")
+        ):
+            raise KeyError(_to_pointer(tokens))
+        i = int(token)
+        if i > len(seq) or (i == len(seq) and not allow_end):
+            raise KeyError(_to_pointer(tokens))
+        return i
+
+    def _is_writable(self, x) -> bool:
+        k = id(x)
+        if k in self.owned:
+            return True
+        if not self.inplace or k in self.shared:
+            return False
+        return not isinstance(x, tuple)
+
+    def _copy(self, x):
+        if hasattr(x, "keys"):
+            r = x.copy()
+            children = r.values()
         else:
-            return None
+            r = children = list(x)
+        # the children are referenced from both, now (in copy mode, the
+        # children of the original document are never modified, anyway)
+        if self.inplace or id(x) in self.shared:
+            for v in children:
+                self._share(v)
+        self.owned[id(r)] = r
+        return r
+
+    def _share(self, x) -> None:
+        if _is_container(x):
+            k = id(x)
+            self.owned.pop(k, None)
+            self.shared[k] = x
+            self.writable_size = 0
+
+
+def _equal(x, y) -> bool:
+    # in json, true is not 1
+    if isinstance(x, bool) or isinstance(y, bool):
+        return x.__class__ is y.__class__ and x == y
+    elif hasattr(x, "keys"):
+        return (
+            hasattr(y, "keys")
+            and len(x) == len(y)
+            and all(k in y and _equal(v, y[k]) for k, v in x.items())
+        )
+    elif isinstance(x, (list, tuple)):
+        return (
+            isinstance(y, (list, tuple))
+            and len(x) == len(y)
+            and all(_equal(a, b) for a, b in zip(x, y))
+        )
+    return x == y
+
+
+def _to_pointer(tokens) -> str:
+    return "".join(_join("", x) for x in tokens)
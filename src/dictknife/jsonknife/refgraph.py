@@ -0,0 +1,197 @@
+import logging
+from collections import defaultdict, deque
+from typing import Optional
+
+from .accessor import path_to_json_pointer, access_by_json_pointer
+
+logger = logging.getLogger(__name__)
+
+# reference graph
+# ----------------------------------------
+#
+# - each file is walked only once, and every `$ref` site is recorded
+#   with its target (globalref = (filename, pointer))
+# - the sites in a file are stored in the same order as DictWalker([is_ref]),
+#   so the sites of any subtree are a contiguous span of them
+# - the targets that cannot be resolved are recorded as None
+#   (the error is raised later, by the resolver's user)
+
+
+class RefSite:
+    __slots__ = ("file", "path", "ref", "target", "resolver", "data")
+
+    def __init__(self, file, path, ref, target, resolver, data) -> None:
+        self.file = file
+        self.path = path  # including "$ref", same as DictWalker([is_ref])
+        self.ref = ref
+        self.target = target  # globalref or None
+        self.resolver = resolver
+        self.data = data
+
+    @property
+    def pointer(self) -> str:
+        return "/" + path_to_json_pointer(self.path[:-1]) if len(self.path) > 1 else ""
+
+    @property
+    def globalref(self) -> tuple[str, str]:
+        return (self.file, self.pointer)
+
+    def __repr__(self) -> str:
+        return "<{} globalref={self.globalref!r}, target={self.target!r}>".format(
+            self.__class__.__name__, self=self
+        )
+
+
+class RefGraph:
+    """Index of the `$ref` sites in the documents, reachable from a resolver.
+
+    Example:
+        graph = RefGraph.from_resolver(resolver)
+        for site in graph.referrers(("/path/to/main.yaml", "/definitions/person")):
+            print(site.globalref)
+    """
+
+    def __init__(self) -> None:
+        self.sites: list[RefSite] = []
+        self.resolvers: dict[str, object] = {}  # filename -> resolver
+        self.nodes: dict[tuple[str, str], object] = {}  # globalref -> data
+        self._referrers: dict[tuple[str, str], list[RefSite]] = defaultdict(list)
+        self._sites_by_file: dict[str, list[RefSite]] = {}
+        self._resolved: set[str] = set()  # filenames, whose sites' targets are resolved
+        # id(node) -> (node, depth, sites, start, end), the node is kept for the identity check
+        self._spans: dict[int, tuple[object, int, list[RefSite], int, int]] = {}
+
+    @classmethod
+    def from_resolver(cls, resolver, *, doc=None) -> "RefGraph":
+        graph = cls()
+        graph.add(resolver, doc=doc)
+        return graph
+
+    def add(self, resolver, *, doc=None) -> None:
+        """Walks the document of the resolver, and the files referenced from it."""
+        q = deque([(resolver, doc)])
+        while q:
+            resolver, doc = q.popleft()
+            if resolver.name in self._resolved:
+                continue
+            self._resolved.add(resolver.name)
+
+            for site in self.index(resolver, doc=doc):
+                try:
+                    subresolver, pointer = resolver.resolve(site.ref)
+                    site.target = (subresolver.name, pointer)
+                    if subresolver.name not in self._resolved:
+                        subresolver.doc  # loading, for checking the existence
+                        q.append((subresolver, None))
+                except Exception as e:
+                    logger.debug("unresolved: %r (where=%r) %r", site.ref, site.file, e)
+                    site.target = None
+                    continue
+                self._referrers[site.target].append(site)
+
+    def index(self, resolver, *, doc=None) -> list[RefSite]:
+        """Walks the document of the resolver only (lazily, the referenced files are not loaded).
+
+        The targets of the sites are not resolved (None), until add() is called.
+        """
+        sites = self._sites_by_file.get(resolver.name)
+        if sites is None:
+            self.resolvers[resolver.name] = resolver
+            sites = self._sites_by_file[resolver.name] = []
+            self._walk(resolver, sites, [], resolver.doc if doc is None else doc)
+            self.sites.extend(sites)
+        return sites
+
+    def _walk(self, resolver, sites: list, path: list, d) -> None:
+        # same order as DictWalker([is_ref]).walk(d)
+        if hasattr(d, "keys"):
+            start = len(sites)
+            for k, v in list(d.items()):
+                path.append(k)
+                if k == "$ref" and hasattr(v, "startswith"):
+                    sites.append(
+                        RefSite(
+                            file=resolver.name,
+                            path=tuple(path),
+                            ref=v,
+                            target=None,
+                            resolver=resolver,
+                            data=d,
+                        )
+                    )
+                else:
+                    self._walk(resolver, sites, path, v)
+                path.pop()
+            self._spans[id(d)] = (d, len(path), sites, start, len(sites))
+        elif isinstance(d, (list, tuple)):
+            start = len(sites)
+            for i, x in enumerate(d):
+                path.append(i)
+                self._walk(resolver, sites, path, x)
+                path.pop()
+            self._spans[id(d)] = (d, len(path), sites, start, len(sites))
+
+    def sites_in(self, d) -> Optional[list[RefSite]]:
+        """Returns the sites in the subtree, or None if it is not indexed."""
+        span = self._spans.get(id(d))
+        if span is None or span[0] is not d:
+            return None
+        _, _, sites, start, end = span
+        return sites[start:end]
+
+    def iterate_in(self, d):
+        """Returns the (path, data) pairs of the sites in the subtree, like DictWalker([is_ref]).iterate(d).
+
+        The paths are relative to the subtree. If it is not indexed, returns None.
+        """
+        span = self._spans.get(id(d))
+        if span is None or span[0] is not d:
+            return None
+        _, depth, sites, start, end = span
+        return ((site.path[depth:], site.data) for site in sites[start:end])
+
+    def referrers(self, globalref: tuple[str, str]) -> list[RefSite]:
+        """Returns the sites referencing the target."""
+        return self._referrers.get(globalref, [])
+
+    def targets(self) -> list[tuple[str, str]]:
+        return list(self._referrers.keys())
+
+    def access(self, globalref: tuple[str, str]):
+        node = self.nodes.get(globalref)
+        if node is None:
+            filename, pointer = globalref
+            node = access_by_json_pointer(self.resolvers[filename].doc, pointer)
+            self.nodes[globalref] = node
+        return node
+
+    def dependencies(self, globalref: tuple[str, str]) -> list[tuple[str, str]]:
+        """Returns the targets referenced from the inside of the target."""
+        try:
+            sites = self.sites_in(self.access(globalref)) or []
+        except KeyError:
+            return []
+        return list(
+            dict.fromkeys(site.target for site in sites if site.target is not None)
+        )
+
+    def toposort(self) -> list[tuple[str, str]]:
+        """Returns the targets, the dependencies first (cycles are broken arbitrarily)."""
+        r: list[tuple[str, str]] = []
+        seen = set()
+        for root in self.targets():
+            if root in seen:
+                continue
+            seen.add(root)
+            stack = [(root, iter(self.dependencies(root)))]
+            while stack:
+                globalref, itr = stack[-1]
+                for dep in itr:
+                    if dep not in seen:
+                        seen.add(dep)
+                        stack.append((dep, iter(self.dependencies(dep))))
+                        break
+                else:
+                    stack.pop()
+                    r.append(globalref)
+        return r
@@ -2,13 +2,14 @@ import sys
 import logging
 import os.path
 from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
 from typing import List, Any, Union, Type
 
 from dictknife import loading
 from dictknife.walkers import DictWalker
 from dictknife.langhelpers import reify, pairrsplit
 
-from .accessor import AccessingMixin
+from .accessor import AccessingMixin, is_ref
 from .relpath import normpath
 from ._wrapped_exception import wrap_exception
 
@@ -44,6 +45,7 @@ class ExternalFileResolver(AccessingMixin):
         onload=None,
         format=None,
         wrap_exception=wrap_exception,
+        prefetcher: "Prefetcher" = None,
     ) -> None:
         self.rawfilename = rawfilename or filename
         self.filename = os.path.normpath(os.path.abspath(str(filename)))
@@ -55,6 +57,7 @@ class ExternalFileResolver(AccessingMixin):
         self.onload = onload
         self.format = format
         self.wrap_exception = wrap_exception
+        self.prefetcher = prefetcher
         if doc is not None:
             self.doc = doc
             if self.onload is not None:
@@ -76,7 +79,11 @@ class ExternalFileResolver(AccessingMixin):
                 self.rawfilename,
                 self.history[-1].filename,
             )
-            self.doc = self.loader.loadfile(self.filename, format=self.format)
+            if self.prefetcher is not None:
+                self.doc = self.prefetcher.load(self, self.filename, format=self.format)
+                self.prefetcher.prefetch(self, self.doc)
+            else:
+                self.doc = self.loader.loadfile(self.filename, format=self.format)
 
             if self.onload is not None:
                 self.onload(self.doc, self)
@@ -99,6 +106,7 @@ class ExternalFileResolver(AccessingMixin):
             onload=self.onload,
             format=format,
             wrap_exception=self.wrap_exception,
+            prefetcher=self.prefetcher,
         )
 
     def resolve_pathset(self, query):  # todo: refactoring
@@ -145,17 +153,88 @@ class ROOT:
     history: List[Any] = []
 
 
-def get_resolver(filename, *, loader=loading, doc=None, onload=None, format=None):
+class Prefetcher:
+    """Loads the files referenced by `$ref`, concurrently and in advance.
+
+    Each time a document is loaded, the external files referenced from it are
+    scheduled onto the executor, so that they are (maybe) ready when they are
+    resolved. The executor is shut down on exit of the `with` block.
+
+    Example:
+        with Prefetcher(max_workers=4) as prefetcher:
+            resolver = get_resolver("main.yaml", prefetcher=prefetcher)
+            r = Bundler(resolver).bundle()
+    """
+
+    def __init__(self, executor: Executor = None, *, max_workers: int = None) -> None:
+        self.executor = executor or ThreadPoolExecutor(max_workers=max_workers)
+        self.futures: dict = {}  # (filename, format) -> future
+
+    @classmethod
+    def from_processes(cls, max_workers: int = None) -> "Prefetcher":
+        """Creates a prefetcher using processes (only for the default loader)."""
+        # the settings of loading.setup() are not inherited on spawn start method
+        settings = loading.get_settings()
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_setup_worker, initargs=(settings,)
+        )
+        return cls(executor)
+
+    def __enter__(self) -> "Prefetcher":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, resolver, filename: str, *, format=None) -> None:
+        k = (filename, format)
+        if k in self.futures:
+            return
+        cached = resolver.cache.get(filename)
+        if cached is not None and "doc" in cached.__dict__:  # already loaded
+            return
+        loader = None if resolver.loader is loading else resolver.loader
+        logger.debug("prefetch: %r", filename)
+        self.futures[k] = self.executor.submit(_loadfile, loader, filename, format)
+
+    def prefetch(self, resolver, doc) -> None:
+        for path, sd in DictWalker([is_ref]).walk(doc):
+            ref = sd["$ref"]
+            if ref.startswith("#"):
+                continue
+            filename, _, _ = resolver.resolve_pathset(ref)
+            self.submit(resolver, filename)
+
+    def load(self, resolver, filename: str, *, format=None):
+        future = self.futures.pop((filename, format), None)
+        if future is None:
+            return resolver.loader.loadfile(filename, format=format)
+        return future.result()
+
+
+def _setup_worker(settings: dict) -> None:
+    loading.setup(**settings)
+
+
+def _loadfile(loader, filename: str, format=None):
+    return (loader or loading).loadfile(filename, format=format)
+
+
+def get_resolver(
+    filename, *, loader=loading, doc=None, onload=None, format=None, prefetcher=None
+):
     if filename is None:
         if doc is None:
             doc = doc or loading.load(sys.stdin)
         return OneDocResolver(doc, onload=onload, format=format)
     else:
         resolver = ExternalFileResolver(
-            filename, loader=loader, onload=onload, format=format
+            filename, loader=loader, onload=onload, format=format, prefetcher=prefetcher
         )
         if doc:
             resolver.doc = doc
+            if prefetcher is not None:
+                prefetcher.prefetch(resolver, doc)
         return resolver
 
 
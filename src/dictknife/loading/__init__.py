@@ -2,9 +2,11 @@
 import sys
 import os.path
 import logging
+import contextlib
 from io import StringIO
 from typing import Callable
 from . import json
+from . import jsonl
 from . import raw
 from . import env
 from . import yaml
@@ -16,6 +18,7 @@ from . import spreadsheet  # optional
 
 logger = logging.getLogger(__name__)
 unknown = "(unknown)"
+_missing = object()
 
 
 class Loader:
@@ -42,6 +45,13 @@ class Loader:
         self.dispatcher = dispatcher
         self.fn_map: dict[str, Callable] = {}
         self.opener_map: dict[str, Callable] = {}
+        self.cache = None  # on-disk parse cache for loadfile(), see setup()
+
+        cache_dir = os.environ.get("DICTKNIFE_CACHE_DIR")
+        if cache_dir:
+            from ._cache import FileCache
+
+            self.cache = FileCache(cache_dir)
 
     def add_format(self, fmt: str, fn: Callable, *, opener: Callable = None) -> None:
         """Adds a new format and its corresponding loading function.
@@ -109,6 +119,9 @@ class Loader:
         If format is not specified, it's guessed from the filename extension.
         Optional dependencies might be required for certain formats (e.g., 'spreadsheet').
 
+        If the parse cache is enabled (see `setup`), the loaded data of regular
+        files is cached on disk, and reused while the file is not modified.
+
         Args:
             filename: The path to the file to load. If None, reads from stdin.
             format: The format of the data. If None, it will be guessed.
@@ -121,17 +134,85 @@ class Loader:
         """
         if filename is None:
             return self.load(sys.stdin, format=format)
+
+        actual_opener: Callable = opener or self.opener_map.get(format) or open
+        cache_key = None
+        if self.cache is not None and actual_opener is open:
+            cache_key = self._make_cache_key(
+                filename, format=format, encoding=encoding, errors=errors
+            )
+            if cache_key is not None:
+                r = self.cache.get(cache_key, _missing)
+                if r is not _missing:
+                    logger.debug("cache hit: %r", filename)
+                    return r
+
+        with actual_opener(filename, encoding=encoding, errors=errors) as rf:
+            r = self.load(rf, format=format, errors=errors)
+            if (
+                not hasattr(r, "keys")
+                and hasattr(r, "__iter__")
+                and not isinstance(r, (str, bytes))
+            ):
+                r = list(r)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, r)
+        return r
+
+    def _make_cache_key(self, filename: str, *, format: str, **options):
+        from .modification import _get_modifications_history
+
+        if format is None:
+            format = os.environ.get("DICTKNIFE_LOAD_FORMAT")
+        if format is None:
+            format = self.dispatcher.guess_format(filename)
+        if format in ("yaml", unknown):
+            from ._lazyimport import m
+
+            options["yaml_typ"] = getattr(m.yaml, "default_typ", None)
+        return self.cache.make_key(
+            filename,
+            format=format,
+            modifications=sorted(_get_modifications_history(self.dispatcher)),
+            **options,
+        )
+
+    @contextlib.contextmanager
+    def openfile(
+        self,
+        filename: str = None,
+        format: str = None,
+        opener: Callable = None,
+        encoding: str = None,
+        errors=None,
+    ):
+        """Loads data from a file or stdin lazily, keeping the file open.
+
+        Unlike `loadfile`, readers (e.g. CSV rows) are not materialized into
+        a list. The file is kept open while the context is active, so the
+        loaded data must be consumed inside of the `with` block.
+
+        Example:
+            with loading.openfile("big.csv") as rows:
+                loading.dumpfile(rows, "big.tsv")
+
+        Args:
+            filename: The path to the file to load. If None, reads from stdin.
+            format: The format of the data. If None, it will be guessed.
+            opener: An optional function to open the file.
+            encoding: The encoding to use when opening the file.
+            errors: Error handling scheme for codecs.
+
+        Yields:
+            The loaded data (possibly an iterator).
+        """
+        if filename is None:
+            yield self.load(sys.stdin, format=format)
         else:
             actual_opener: Callable = opener or self.opener_map.get(format) or open
             with actual_opener(filename, encoding=encoding, errors=errors) as rf:
-                r = self.load(rf, format=format, errors=errors)
-                if (
-                    not hasattr(r, "keys")
-                    and hasattr(r, "__iter__")
-                    and not isinstance(r, (str, bytes))
-                ):
-                    r = list(r)
-                return r
+                yield self.load(rf, format=format, errors=errors)
 
 
 class Dumper:
@@ -157,15 +238,41 @@ class Dumper:
         """
         self.dispatcher = dispatcher
         self.fn_map: dict[str, Callable] = {}
+        self.streaming_formats: set[str] = set()
 
-    def add_format(self, fmt: str, fn: Callable) -> None:
+    def add_format(self, fmt: str, fn: Callable, *, streaming: bool = False) -> None:
         """Adds a new format and its corresponding dumping function.
 
         Args:
             fmt: The format identifier (e.g., "json", "yaml").
             fn: The function to call for dumping this format.
+            streaming: If True, the dumping function consumes iterators lazily,
+                       so `dumpfile` passes them through without materializing.
         """
         self.fn_map[fmt] = fn
+        if streaming:
+            self.streaming_formats.add(fmt)
+        else:
+            self.streaming_formats.discard(fmt)
+
+    def detect_format(self, filename: str = None, *, format: str = None) -> str:
+        """Guesses the output format, in the same manner as `dump`.
+
+        Args:
+            filename: The name of the output file. If None, stdout is assumed.
+            format: The explicitly specified format, if any.
+
+        Returns:
+            The format string used for dumping.
+        """
+        if format is not None:
+            return format
+        format = os.environ.get("DICTKNIFE_DUMP_FORMAT")
+        if format is not None:
+            return format
+        if filename is None:
+            filename = getattr(sys.stdout, "name", unknown)
+        return self.dispatcher.guess_format(filename)
 
     def dumps(
         self, d, *, format: str = None, sort_keys: bool = False, extra=None, **kwargs
@@ -237,7 +344,11 @@ class Dumper:
             _retry: Internal flag for retrying after directory creation.
         """
         if hasattr(d, "__next__"):  # iterator
-            d = list(d)
+            if (
+                self.detect_format(filename, format=format)
+                not in self.streaming_formats
+            ):
+                d = list(d)
 
         if filename is None:
             return self.dump(
@@ -318,6 +429,7 @@ class Dispatcher:
         *,
         exts: list[str] = [],
         opener: Callable = None,
+        streaming: bool = False,
     ) -> None:
         """Adds a new format with its load, dump functions, and associated extensions.
 
@@ -327,19 +439,26 @@ class Dispatcher:
             dump: The function to call for dumping this format.
             exts: A list of file extensions associated with this format (e.g., [".json", ".js"]).
             opener: An optional function to open files for this format (for loader).
+            streaming: If True, the dump function can consume iterators lazily (for dumper).
         """
         self.loader.add_format(fmt, load, opener=opener)
-        self.dumper.add_format(fmt, dump)
+        self.dumper.add_format(fmt, dump, streaming=streaming)
         for ext in exts:
             self.exts_matching[ext] = fmt
 
 
 dispatcher = Dispatcher()
 dispatcher.add_format("yaml", yaml.load, yaml.dump, exts=[".yaml", ".yml"])
-dispatcher.add_format("json", json.load, json.dump, exts=[".json", ".js"])
+dispatcher.add_format(
+    "json", json.load, json.dump, exts=[".json", ".js"], streaming=True
+)
+dispatcher.add_format(
+    "jsonl", jsonl.load, jsonl.dump, exts=[".jsonl", ".ndjson"], streaming=True
+)
+dispatcher.add_format("ndjson", jsonl.load, jsonl.dump, exts=[], streaming=True)
 dispatcher.add_format("toml", toml.load, toml.dump, exts=[".toml"])
-dispatcher.add_format("csv", csv.load, csv.dump, exts=[".csv"])
-dispatcher.add_format("tsv", tsv.load, tsv.dump, exts=[".tsv"])
+dispatcher.add_format("csv", csv.load, csv.dump, exts=[".csv"], streaming=True)
+dispatcher.add_format("tsv", tsv.load, tsv.dump, exts=[".tsv"], streaming=True)
 dispatcher.add_format("raw", raw.load, raw.dump, exts=[])
 dispatcher.add_format("env", env.load, None, exts=[".env", ".environ"])
 dispatcher.add_format("md", md.load, md.dump, exts=[".md", ".mdtable"])
@@ -360,6 +479,8 @@ loadfile = dispatcher.loader.loadfile
 For information on optional dependencies required by certain file formats,
 please refer to the `Loader` class docstring or the project documentation.
 """
+openfile = dispatcher.loader.openfile
+"""Alias for `dispatcher.loader.openfile`."""
 dump = dispatcher.dumper.dump
 """Alias for `dispatcher.dumper.dump`."""
 dumps = dispatcher.dumper.dumps
@@ -430,11 +551,50 @@ def get_unknown(dispatcher=dispatcher):
     return sys.modules[loader.__module__]
 
 
+def get_json_backends() -> list[str]:
+    """Returns a list of available json backend names.
+
+    Returns:
+        A list of backend names (e.g., ["auto", "orjson", "ujson", "json"]).
+    """
+    from ._json import get_backend_names
+
+    return get_backend_names()
+
+
+def get_settings(dispatcher=dispatcher) -> dict:
+    """Returns the current settings, as the keyword arguments of `setup()`.
+
+    The settings of `setup()` are not inherited by the processes started with
+    the spawn start method, so pass them to the worker processes.
+
+    Args:
+        dispatcher: The dispatcher instance to use.
+
+    Returns:
+        A dictionary with json_backend, yaml_typ, cache_dir and cache_max_size.
+    """
+    from ._lazyimport import m
+
+    cache = dispatcher.loader.cache
+    return {
+        "json_backend": m.json.name,
+        "yaml_typ": getattr(m.yaml, "default_typ", None),
+        "cache_dir": cache.dirpath if cache is not None else None,
+        "cache_max_size": cache.max_size if cache is not None else None,
+    }
+
+
 def setup(
     input: Callable = None,
     output: Callable = None,
     dispatcher=dispatcher,
     unknown=unknown,
+    *,
+    json_backend: str = None,
+    yaml_typ: str = None,
+    cache_dir: str = None,
+    cache_max_size: int = None,
 ) -> None:
     """Configures the default loader and dumper for 'unknown' formats.
 
@@ -446,7 +606,35 @@ def setup(
         output: The function to use for dumping unknown formats.
         dispatcher: The dispatcher instance to configure.
         unknown: The identifier for the unknown format.
+        json_backend: The library used for json/jsonl ("auto", "orjson", "ujson" or "json").
+                      If None, the DICTKNIFE_JSON_BACKEND environment variable is used
+                      ("auto" by default, the fastest installed library is chosen).
+        yaml_typ: The kind of yaml loader ("rt" or "safe"). "rt" (default) preserves
+                  comments and quotes, "safe" is faster (C-accelerated if available)
+                  and suitable for read only usage.
+        cache_dir: The directory of the on-disk parse cache for `loadfile`. If None,
+                   the DICTKNIFE_CACHE_DIR environment variable is used (disabled by default).
+                   The cache is stored with pickle, so don't use a directory shared with others.
+        cache_max_size: The maximum total size (in bytes) of the parse cache.
     """
+    if json_backend is not None:
+        from ._lazyimport import m
+        from ._json import get_backend
+
+        logger.debug("setup json backend: %s", json_backend)
+        m.json = get_backend(json_backend)
+    if yaml_typ is not None:
+        from ._lazyimport import m
+
+        logger.debug("setup yaml typ: %s", yaml_typ)
+        m.yaml.default_typ = yaml_typ
+    if cache_dir is not None:
+        from ._cache import FileCache
+
+        logger.debug("setup cache dir: %s", cache_dir)
+        dispatcher.loader.cache = FileCache(cache_dir)
+    if cache_max_size is not None and dispatcher.loader.cache is not None:
+        dispatcher.loader.cache.max_size = cache_max_size
     if input is not None:
         logger.debug("setup input format: %s", input)
         dispatcher.loader.add_format(unknown, input)
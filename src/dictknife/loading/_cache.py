@@ -0,0 +1,121 @@
+import os
+import os.path
+import stat
+import pickle
+import hashlib
+import tempfile
+from logging import getLogger as get_logger
+from dictknife.__version__ import VERSION
+
+logger = get_logger(__name__)
+
+# parse cache
+# ----------------------------------------
+#
+# - the key is (absolute path, size, mtime_ns, format, loader options)
+# - the value is the loaded document, pickled
+# - when the total size exceeds max_size, the least recently used entries are removed
+# - pickle is not safe for untrusted data, so don't share the cache directory with others
+
+
+class FileCache:
+    suffix = ".pickle"
+
+    def __init__(self, dirpath: str, *, max_size: int = 256 * 1024 * 1024) -> None:
+        self.dirpath = dirpath
+        self.max_size = max_size
+        self._size = None  # total size of entries, computed lazily
+
+    def __repr__(self) -> str:
+        return "<{self.__class__.__name__} {self.dirpath!r}>".format(self=self)
+
+    def make_key(self, filename: str, **options):
+        """Returns the key for the file, or None if the file is not cacheable."""
+        try:
+            st = os.stat(filename)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):  # e.g. named pipe (<(...) in bash)
+            return None
+        src = repr(
+            (
+                os.path.abspath(filename),
+                st.st_size,
+                st.st_mtime_ns,
+                sorted(options.items()),
+                VERSION,
+            )
+        )
+        return hashlib.sha1(src.encode("utf-8")).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.dirpath, key + self.suffix)
+
+    def get(self, key: str, default=None):
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as rf:
+                value = pickle.load(rf)
+        except FileNotFoundError:
+            return default
+        except Exception as e:
+            logger.info("broken cache %r, removed (%r)", path, e)
+            self._remove(path)
+            return default
+        try:
+            os.utime(path)  # for LRU
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value) -> None:
+        os.makedirs(self.dirpath, exist_ok=True)
+        path = self._get_path(key)
+        fd, tmppath = tempfile.mkstemp(dir=self.dirpath, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as wf:
+                pickle.dump(value, wf, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmppath, path)  # atomic, for concurrent processes
+        except Exception as e:
+            logger.debug("cannot cache %r (%r)", path, e)
+            self._remove(tmppath)
+            return
+
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._scan())
+        else:
+            self._size += os.path.getsize(path)
+        if self._size > self.max_size:
+            self.evict()
+
+    def evict(self) -> None:
+        entries = sorted(self._scan())  # older first
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            logger.debug("evict cache %r", path)
+            self._remove(path)
+            total -= size
+        self._size = total
+
+    def _scan(self):
+        try:
+            itr = os.scandir(self.dirpath)
+        except FileNotFoundError:
+            return
+        with itr:
+            for entry in itr:
+                if not entry.name.endswith(self.suffix):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                yield (st.st_mtime_ns, st.st_size, entry.path)
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,246 @@
+import re
+import json
+import math
+from logging import getLogger as get_logger
+
+logger = get_logger(__name__)
+
+# json backend
+# ----------------------------------------
+#
+# - each backend has the same interface as stdlib's json (load, loads, dump, dumps)
+# - the output must be the same as stdlib's json (except the notation of floats
+#   in exponent form, e.g. 1e-07 vs 1e-7), so the fast path is used only for
+#   options (and values, e.g. NaN) that the library supports, otherwise it falls
+#   back to stdlib's json
+
+
+class StdlibBackend:
+    name = "json"
+
+    def loads(self, s, *, object_pairs_hook=None, **kwargs):
+        if object_pairs_hook is dict:  # dict is already ordered
+            object_pairs_hook = None
+        return json.loads(s, object_pairs_hook=object_pairs_hook, **kwargs)
+
+    def load(self, fp, **kwargs):
+        return self.loads(fp.read(), **kwargs)
+
+    def dumps(self, d, **kwargs) -> str:
+        return json.dumps(d, **kwargs)
+
+    def dump(self, d, fp, **kwargs):
+        return json.dump(d, fp, **kwargs)
+
+
+class OrjsonBackend(StdlibBackend):
+    name = "orjson"
+    # orjson loads integers larger than 64bit as float (losing precision)
+    maybe_bigint = re.compile(r"\d{19,}").search
+
+    def __init__(self) -> None:
+        import orjson
+
+        self.orjson = orjson
+
+    def loads(self, s, *, object_pairs_hook=None, **kwargs):
+        if kwargs or object_pairs_hook not in (None, dict):
+            return super().loads(s, object_pairs_hook=object_pairs_hook, **kwargs)
+        if self.maybe_bigint(s) is not None:
+            return super().loads(s)
+        try:
+            return self.orjson.loads(s)
+        except self.orjson.JSONDecodeError:
+            # e.g. NaN (stdlib's json raises the error, if really broken)
+            return super().loads(s)
+
+    def dumps(
+        self,
+        d,
+        *,
+        indent=None,
+        ensure_ascii: bool = True,
+        sort_keys: bool = False,
+        default=None,
+        separators=None,
+        **kwargs,
+    ) -> str:
+        # orjson's output is the same as json.dumps(indent=2) or the compact one
+        # (separators=(",", ":")), e.g. for jsonl
+        if indent == 2:
+            supported = separators is None or tuple(separators) == (",", ": ")
+        else:
+            supported = indent is None and tuple(separators or ()) == (",", ":")
+        if kwargs or not supported or ensure_ascii:
+            return super().dumps(
+                d,
+                indent=indent,
+                ensure_ascii=ensure_ascii,
+                sort_keys=sort_keys,
+                default=default,
+                separators=separators,
+                **kwargs,
+            )
+
+        orjson = self.orjson
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        nonfinite = []
+
+        def _default(o):
+            # subclass of float (e.g. ruamel.yaml's ScalarFloat) is not supported
+            if isinstance(o, float):
+                return float(o)
+            if default is None:
+                raise TypeError(
+                    "Object of type {} is not JSON serializable".format(
+                        o.__class__.__name__
+                    )
+                )
+            r = default(o)
+            if _has_nonfinite(r):
+                nonfinite.append(r)
+            return r
+
+        try:
+            b = orjson.dumps(d, default=_default, option=option)
+            # orjson writes NaN and Infinity as null (stdlib's json writes NaN, Infinity).
+            # the values are walked only if null is found (and repr() says maybe)
+            if not (nonfinite or (b"null" in b and _maybe_nonfinite(d))):
+                return b.decode("utf-8")
+            logger.debug("orjson: NaN or Infinity is found, failback to json")
+        except orjson.JSONEncodeError as e:
+            logger.debug("orjson: %r, failback to json", e)
+        return super().dumps(
+            d,
+            indent=indent,
+            ensure_ascii=ensure_ascii,
+            sort_keys=sort_keys,
+            default=default,
+            separators=separators,
+        )
+
+    def dump(self, d, fp, **kwargs):
+        return fp.write(self.dumps(d, **kwargs))
+
+
+def _maybe_nonfinite(d) -> bool:
+    r = repr(d)  # fast, e.g. {'x': nan, 'y': [-inf]}
+    return ("nan" in r or "inf" in r) and _has_nonfinite(d)
+
+
+def _has_nonfinite(d) -> bool:
+    stack = [d]
+    while stack:
+        d = stack.pop()
+        if isinstance(d, float):
+            if not math.isfinite(d):
+                return True
+        elif hasattr(d, "keys"):
+            for k, v in d.items():
+                if isinstance(k, float) and not math.isfinite(k):
+                    return True
+                stack.append(v)
+        elif isinstance(d, (list, tuple)):
+            stack.extend(d)
+    return False
+
+
+class UjsonBackend(StdlibBackend):
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson
+
+        self.ujson = ujson
+
+    def loads(self, s, *, object_pairs_hook=None, **kwargs):
+        if kwargs or object_pairs_hook not in (None, dict):
+            return super().loads(s, object_pairs_hook=object_pairs_hook, **kwargs)
+        try:
+            return self.ujson.loads(s)
+        except ValueError:
+            return super().loads(s)
+
+    def dumps(
+        self,
+        d,
+        *,
+        indent=None,
+        ensure_ascii: bool = True,
+        sort_keys: bool = False,
+        default=None,
+        **kwargs,
+    ) -> str:
+        if kwargs or indent is None or not isinstance(indent, int):
+            return super().dumps(
+                d,
+                indent=indent,
+                ensure_ascii=ensure_ascii,
+                sort_keys=sort_keys,
+                default=default,
+                **kwargs,
+            )
+        try:
+            return self.ujson.dumps(
+                d,
+                indent=indent,
+                ensure_ascii=ensure_ascii,
+                sort_keys=sort_keys,
+                default=default,
+                escape_forward_slashes=False,
+            )
+        except (TypeError, OverflowError) as e:
+            logger.debug("ujson: %r, failback to json", e)
+            return super().dumps(
+                d,
+                indent=indent,
+                ensure_ascii=ensure_ascii,
+                sort_keys=sort_keys,
+                default=default,
+            )
+
+    def dump(self, d, fp, **kwargs):
+        return fp.write(self.dumps(d, **kwargs))
+
+
+_backends = {
+    OrjsonBackend.name: OrjsonBackend,
+    UjsonBackend.name: UjsonBackend,
+    StdlibBackend.name: StdlibBackend,
+}
+
+
+def get_backend_names() -> list[str]:
+    return ["auto", *_backends.keys()]
+
+
+def get_backend(name: str = "auto"):
+    """Returns a json backend.
+
+    If name is "auto", the fastest installed library is used
+    (orjson, ujson, and stdlib's json, in this order).
+    """
+    if name == "auto":
+        for cls in _backends.values():
+            try:
+                return cls()
+            except ImportError:
+                continue
+    try:
+        cls = _backends[name]
+    except KeyError:
+        raise ValueError(
+            "unsupported json backend: {!r} (choices: {})".format(
+                name, ", ".join(get_backend_names())
+            )
+        )
+    return cls()
@@ -1,3 +1,4 @@
+import os
 from logging import getLogger as get_logger
 from dictknife.langhelpers import reify
 
@@ -7,9 +8,9 @@ logger = get_logger(__name__)
 class LoadingModule:
     @reify
     def json(self):
-        import json
+        from ._json import get_backend
 
-        return json
+        return get_backend(os.environ.get("DICTKNIFE_JSON_BACKEND") or "auto")
 
     @reify
     def toml(self):
@@ -59,9 +60,10 @@ class LoadingModule:
             class _fake_yaml:
                 SortedDumper = None
                 Loader = None
+                default_typ = "rt"
 
                 @classmethod
-                def load(cls, *args, typ: str = "rt", loader=None, **kwargs):
+                def load(cls, *args, typ: str = None, loader=None, **kwargs):
                     return json.load(*args, **kwargs)
 
                 @classmethod
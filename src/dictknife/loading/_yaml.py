@@ -1,3 +1,4 @@
+import threading
 import ruamel.yaml
 
 # dumping spec
@@ -9,25 +10,45 @@ import ruamel.yaml
 #   - quoted when contains '#' or ':'
 # - Mapping type is treated as dict (e.g. defaultdict, ChainMap, OrderedDict)
 
-_pool = {}  # xxx: memory leak
+# loading spec
+# ----------------------------------------
+#
+# - typ="rt" (default), round trip loader, preserving comments and quotes
+# - typ="safe", C-accelerated safe loader (if ruamel.yaml.clib is installed),
+#   for read only usage. loaded data is plain dict/list (not CommentedMap)
 
+default_typ = "rt"
 
-def load(fp, *args, typ: str = "rt", **kwargs):
-    yaml = ruamel.yaml.YAML(typ=typ)  # use round trip loader
-    yaml.preserve_quotes = True
-    # use plugins?
-    d = yaml.load(fp)
-    _pool[id(d)] = yaml
-    return d
+# YAML instances are reusable (but not thread safe), so they are cached per thread and typ
+_local = threading.local()
 
 
-def dump(d, fp, *args, typ: str = "rt", **kwargs):
-    yaml = _pool.get(id(d)) or ruamel.yaml.YAML(typ=typ)
+def _ignore_aliases(data) -> bool:
+    return True
+
 
-    def ignore_aliases(data) -> bool:
-        return True
+def _get_yaml(typ: str):
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = _local.pool = {}
+    yaml = pool.get(typ)
+    if yaml is None:
+        if typ == "safe":
+            yaml = ruamel.yaml.YAML(typ="safe", pure=False)
+        else:
+            yaml = ruamel.yaml.YAML(typ=typ)  # use round trip loader
+            yaml.preserve_quotes = True
+        yaml.indent(mapping=2, sequence=2, offset=0)
+        yaml.representer.ignore_aliases = _ignore_aliases
+        pool[typ] = yaml
+    return yaml
 
-    yaml.indent(mapping=2, sequence=2, offset=0)
-    yaml.representer.ignore_aliases = ignore_aliases
+
+def load(fp, *args, typ: str = None, **kwargs):
+    # use plugins?
+    return _get_yaml(typ or default_typ).load(fp)
+
+
+def dump(d, fp, *args, typ: str = "rt", **kwargs):
     # use plugins?
-    return yaml.dump(d, fp)
+    return _get_yaml(typ).dump(d, fp)
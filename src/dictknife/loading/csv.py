@@ -1,7 +1,8 @@
 import sys
+import itertools
 from ._lazyimport import m
 from dictknife.langhelpers import make_dict
-from dictknife.guessing import guess
+from dictknife.guessing import ColumnGuesser
 from logging import getLogger as get_logger
 
 logger = get_logger(__name__)
@@ -80,6 +81,7 @@ def dump(
         fullscan: If True, scans all rows to determine the complete set of headers.
                   If False (default), only the keys from the first row are used,
                   which is faster but may miss headers present only in later rows.
+                  In this case, `rows` is consumed lazily (streaming).
     """
     if not rows:
         return
@@ -106,8 +108,8 @@ def dump(
         itr_for_writing = iter(scanned)
     else:
         # If not fullscan, itr still has remaining items (if any)
-        # We need to write the first_row (already in scanned) and then the rest of itr
-        itr_for_writing = iter(scanned + list(itr))
+        # We write the first_row (already in scanned) and then the rest of itr lazily
+        itr_for_writing = itertools.chain(scanned, itr)
 
     if sort_keys:
         fields = sorted(
@@ -126,7 +128,8 @@ def dump(
 def _create_reader_class(csv_module, errors=None, retry: int = 10):
     """Creates a custom csv.DictReader class.
 
-    This custom reader handles type guessing for cell values and provides
+    This custom reader handles type guessing for cell values (column by column,
+    see ColumnGuesser) and provides
     an option to ignore lines with parsing errors.
     It also includes a workaround for Python versions older than 3.6.
 
@@ -178,7 +181,7 @@ def _create_reader_class(csv_module, errors=None, retry: int = 10):
         def __next__(self, current_retry=retry):  # Renamed arg to avoid conflict
             try:
                 d = original_next(self)
-                return guess(d, mutable=True)  # Type guess values
+                return self.guesser.guess(d)  # Type guess values
             except csv_module.Error as e:
                 logger.info(
                     "line=%d CSV parsing error occurred, skipping. Error: %r",
@@ -201,7 +204,12 @@ def _create_reader_class(csv_module, errors=None, retry: int = 10):
             self, current_retry=None
         ):  # Added current_retry for signature consistency
             d = original_next(self)
-            return guess(d, mutable=True)  # Type guess values
+            return self.guesser.guess(d)  # Type guess values
+
+    def __init__(self, *args, **kwargs):
+        base_dict_reader.__init__(self, *args, **kwargs)
+        # the values are guessed column by column (sampling the first rows)
+        self.guesser = ColumnGuesser()
 
     # Create a new class with the modified __next__
     # The name of the class is dynamic to reflect its configuration if needed,
@@ -210,7 +218,9 @@ def _create_reader_class(csv_module, errors=None, retry: int = 10):
         f"CustomDictReader_{errors}" if errors else "CustomDictReader_strict"
     )
     CustomDictReader = type(
-        custom_reader_name, (base_dict_reader,), {"__next__": __next__}
+        custom_reader_name,
+        (base_dict_reader,),
+        {"__init__": __init__, "__next__": __next__},
     )
 
     return CustomDictReader
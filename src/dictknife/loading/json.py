@@ -33,6 +33,9 @@ def dump(
 ):
     """Dumps a Python object to a file-like object in JSON format.
 
+    If `d` is an iterator, it is written as a JSON array element by element,
+    without materializing it.
+
     Args:
         d: The Python object to dump.
         fp: A file-like object supporting .write().
@@ -49,6 +52,15 @@ def dump(
                  serialized. It should return a JSON encodable version of the
                  object or raise a TypeError. Defaults to `str`.
     """
+    if hasattr(d, "__next__"):  # iterator
+        return _dump_iterator(
+            d,
+            fp,
+            ensure_ascii=ensure_ascii,
+            indent=indent,
+            default=default,
+            sort_keys=sort_keys,
+        )
     return m.json.dump(
         d,
         fp,
@@ -57,3 +69,27 @@ def dump(
         default=default,
         sort_keys=sort_keys,
     )
+
+
+def _dump_iterator(itr, fp, *, indent, **kwargs) -> None:
+    """Dumps an iterator as a JSON array, writing each element as it arrives.
+
+    The output is the same as dumping `list(itr)`.
+    """
+    if indent is None:
+        sep, prefix, suffix, margin = ", ", "[", "]", None
+    else:
+        margin = " " * indent if isinstance(indent, int) else indent
+        sep, prefix, suffix = ",\n", "[\n", "\n]"
+
+    dumps = m.json.dumps
+    empty = True
+    for x in itr:
+        fp.write(prefix if empty else sep)
+        empty = False
+        s = dumps(x, indent=indent, **kwargs)
+        if margin is not None:
+            # newlines inside of strings are escaped, so splitting is safe
+            s = "\n".join(margin + line for line in s.split("\n"))
+        fp.write(s)
+    fp.write("[]" if empty else suffix)
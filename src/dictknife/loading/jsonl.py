@@ -0,0 +1,78 @@
+# JSON Lines (a.k.a. ndjson) format
+from logging import getLogger as get_logger
+from dictknife.langhelpers import make_dict
+from .raw import setup_extra_parser  # noqa
+from ._lazyimport import m
+
+logger = get_logger(__name__)
+
+
+def load(fp, *, loader=None, errors=None, object_pairs_hook=make_dict):
+    """Loads JSON Lines data from a file-like object, one record at a time.
+
+    Blank lines are skipped. Records are decoded lazily while iterating,
+    so the whole stream is never held in memory.
+
+    Args:
+        fp: A file-like object supporting iteration (e.g., an open file).
+        loader: (Unused) The loader instance.
+        errors: Error handling scheme. If "ignore", lines that are not valid
+                JSON are logged and skipped.
+        object_pairs_hook: A function that will be called with the ordered list
+                           of pairs of each decoded JSON object.
+                           Defaults to `make_dict` from `dictknife.langhelpers`.
+
+    Yields:
+        The Python object decoded from each line.
+    """
+    for lineno, line in enumerate(fp, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield m.json.loads(line, object_pairs_hook=object_pairs_hook)
+        except ValueError as e:
+            if errors != "ignore":
+                raise
+            logger.info(
+                "line=%d JSON parsing error occurred, skipping. Error: %r", lineno, e
+            )
+
+
+def dump(
+    rows,
+    fp,
+    *,
+    ensure_ascii: bool = False,
+    sort_keys: bool = False,
+    default=str,
+) -> None:
+    """Dumps records to a file-like object in JSON Lines format.
+
+    Each record is written as soon as it is taken from `rows`, so iterators
+    are consumed lazily.
+
+    Args:
+        rows: An iterable of records to dump. If a single dictionary is passed,
+              it's written as one line.
+        fp: A file-like object supporting .write().
+        ensure_ascii: If True, non-ASCII characters are escaped.
+        sort_keys: If True, dictionary keys will be sorted in each line.
+        default: A function that gets called for objects that can't otherwise be
+                 serialized. Defaults to `str`.
+    """
+    if hasattr(rows, "keys") or isinstance(rows, (str, bytes)):
+        rows = [rows]
+
+    dumps = m.json.dumps
+    for row in rows:
+        fp.write(
+            dumps(
+                row,
+                ensure_ascii=ensure_ascii,
+                sort_keys=sort_keys,
+                default=default,
+                separators=(",", ":"),  # compact (the fast path of orjson is used)
+            )
+        )
+        fp.write("\n")
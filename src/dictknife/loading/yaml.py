@@ -12,7 +12,8 @@ def load(fp, *, errors=None, **kwargs):
         fp: A file-like object supporting .read().
         errors: (Unused by ruamel.yaml's load in this context, but kept for API consistency)
                 Error handling scheme.
-        **kwargs: Additional keyword arguments passed to `ruamel.yaml.YAML().load()`.
+        **kwargs: Additional keyword arguments passed to the yaml loader
+                  (e.g. typ="safe" for the faster, non round trip loader).
 
     Returns:
         The Python object loaded from YAML.
@@ -115,3 +115,43 @@ class And(object):
             if not apply(e, v, *args):
                 return False
         return True
+
+
+def compile_matcher(q):
+    """Compiles a query to a function, the same as `lambda k, v: apply(q, k, v)`.
+
+    The operators (Regexp, Any, Not, Or and And) are unfolded, and literal values
+    are compared directly, so the dispatch of `apply()` is skipped on each call.
+
+    Args:
+        q: The query or callable.
+
+    Returns:
+        A function taking a key and a value.
+    """
+    cls = type(q)
+    if cls is Any:
+        return _always
+    elif cls is Regexp:
+        search = q.args.search
+        return lambda k, v: search(k)
+    elif cls is Not:
+        m = compile_matcher(q.args)
+        return lambda k, v: not m(k, v)
+    elif cls is Or:
+        ms = [compile_matcher(e) for e in q.args]
+        return lambda k, v: any(m(k, v) for m in ms)
+    elif cls is And:
+        ms = [compile_matcher(e) for e in q.args]
+        if len(ms) == 2:
+            m0, m1 = ms
+            return lambda k, v: bool(m0(k, v) and m1(k, v))
+        return lambda k, v: all(m(k, v) for m in ms)
+    elif callable(q):
+        return q
+    else:
+        return lambda k, v: q == k
+
+
+def _always(k, v) -> bool:
+    return True
@@ -1,5 +1,6 @@
+import random
 from functools import partial
-from collections import defaultdict, namedtuple
+from collections import namedtuple
 from .langhelpers import as_jsonpointer
 from typing import Iterator
 
@@ -7,18 +8,68 @@ Row = namedtuple("Row", "path, type, example")
 
 
 class _State:
-    def __init__(self) -> None:
-        self.paths: list = []
-        self.examples: defaultdict = defaultdict(list)
+    """Summary of the values found at each path.
+
+    The memory usage is proportional to the number of paths (not to the data size),
+    only the first example and a few sampled ones (reservoir sampling) are kept.
+    """
 
-    def emit(self, path, example) -> None:
-        path = tuple(path[:])
-        if path not in self.examples:
+    def __init__(self, *, max_examples: int = 5, seed: int = 0) -> None:
+        self.paths: list = []
+        self.counts: dict = {}  # path -> the number of values
+        self.types: dict = {}  # path -> the set of types
+        self.examples: dict = {}  # path -> [first example, *sampled examples]
+        self.max_examples = max_examples
+        self._random = random.Random(seed)
+
+    def emit(self, path, example, *, cls=None) -> None:
+        """Records the value, it is stored as cls(example) if cls is passed."""
+        path = tuple(path)
+        n = self.counts.get(path, 0)
+        if n == 0:
             self.paths.append(path)
-        self.examples[path].append(example)
+            self.counts[path] = 1
+            self.types[path] = {cls or type(example)}
+            self.examples[path] = [example if cls is None else cls(example)]
+            return
+
+        self.counts[path] = n + 1
+        self.types[path].add(cls or type(example))
+        examples = self.examples[path]
+        size = self.max_examples - 1  # the first one is always kept
+        if len(examples) <= size:
+            examples.append(example if cls is None else cls(example))
+        else:
+            i = int(self._random.random() * n)  # faster than randrange()
+            if i < size:
+                examples[i + 1] = example if cls is None else cls(example)
 
     def count(self, path):
-        return len(self.examples[path])
+        return self.counts.get(path, 0)
+
+    def merge(self, other: "_State") -> None:
+        """Merges the other state (e.g. the summary of the following values)."""
+        size = self.max_examples - 1
+        for path in other.paths:
+            n = other.counts[path]
+            m = self.counts.get(path, 0)
+            if m == 0:
+                self.paths.append(path)
+                self.counts[path] = n
+                self.types[path] = set(other.types[path])
+                self.examples[path] = other.examples[path][: size + 1]
+                continue
+
+            self.counts[path] = m + n
+            self.types[path].update(other.types[path])
+            # weighted sampling, each example represents the values of its side
+            mine = self.examples[path][1:]
+            theirs = other.examples[path]
+            candidates = [((m - 1) / len(mine), x) for x in mine]
+            candidates.extend((n / len(theirs), x) for x in theirs)
+            rand = self._random.random
+            candidates.sort(key=lambda c: rand() ** (1.0 / c[0]), reverse=True)
+            self.examples[path][1:] = [x for _, x in candidates[:size]]
 
     def __iter__(self) -> Iterator:
         return iter(self.paths)
@@ -33,23 +84,37 @@ class Traverser:
         self._traverse(d, s, [])
         return s
 
+    def traverse_items(self, items, s=None):
+        """Traverses the items of a list, without the list itself (partial state)."""
+        if s is None:
+            s = _State()
+        path = ["[]"]
+        for x in items:
+            self._traverse(x, s, path)
+        return s
+
     def _traverse(self, d, s, path) -> None:
         if hasattr(d, "keys"):
             self._traverse_dict(d, s, path)
         elif isinstance(d, (list, tuple)):
             self._traverse_list(d, s, path)
+        elif hasattr(d, "__next__"):  # iterator, traversed lazily (as list)
+            self._traverse_list(d, s, path)
         else:
             self._traverse_atom(d, s, path)
 
     def _traverse_dict(self, d, s, path) -> None:
-        s.emit(path, dict(d))
+        s.emit(path, d, cls=dict)
         for k in self.iterate(d.keys()):
             path.append(k)
             self._traverse(d[k], s, path)
             path.pop()
 
     def _traverse_list(self, xs, s, path) -> None:
-        s.emit(path, list(xs))
+        if hasattr(xs, "__next__"):
+            s.emit(path, [])  # the items are not kept
+        else:
+            s.emit(path, xs, cls=list)
         path.append("[]")
         for x in xs:
             self._traverse(x, s, path)
@@ -59,6 +124,19 @@ class Traverser:
         s.emit(path, v)
 
 
+def merge_states(states) -> _State:
+    """Merges the partial states of Traverser.traverse_items(), in order.
+
+    The result is the same as traversing the list of all the items, so the items
+    can be summarized independently (e.g. in parallel), and combined at the end.
+    """
+    s = _State()
+    s.emit([], [], cls=list)  # the list itself
+    for other in states:
+        s.merge(other)
+    return s
+
+
 def _build_pathlist_from_state(
     s,
     *,
@@ -92,7 +170,7 @@ def _build_pathlist_from_state(
         r.append(
             Row(
                 path=fmt.format(separator.join(map(transform, path))),
-                type=sorted(set([type(v) for v in s.examples[rawpath]]), key=str),
+                type=sorted(s.types[rawpath], key=str),
                 example=s.examples[rawpath][0],
             )
         )
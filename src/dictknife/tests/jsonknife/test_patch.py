@@ -38,11 +38,7 @@ class Tests(unittest.TestCase):
             C(
                 src={"point0": {"value": 10}},
                 dst={"point1": {"value": 10}},
-                # todo: move
-                want=[
-                    {"op": "remove", "path": "/point0"},
-                    {"op": "add", "path": "/point1", "value": {"value": 10}},
-                ],
+                want=[{"op": "move", "from": "/point0", "path": "/point1"}],
                 skip_patch=False,
             ),
             C(
@@ -65,12 +61,41 @@ class Tests(unittest.TestCase):
                 src=[{}, {"person": {"name": "foo", "age": 20, "type": "P"}}],
                 dst=[{"person": {"name": "bar", "nickname": "B", "type": "P"}}, {}],
                 want=[
+                    {"path": "/1", "op": "remove"},
                     {
-                        "path": "/0/person",
+                        "path": "/0",
                         "op": "add",
-                        "value": {"name": "bar", "nickname": "B", "type": "P"},
+                        "value": {
+                            "person": {"name": "bar", "nickname": "B", "type": "P"}
+                        },
                     },
-                    {"path": "/1/person", "op": "remove"},
+                ],
+                skip_patch=False,
+            ),
+            C(
+                src={"point0": {"value": 10}},
+                dst={"point0": {"value": 10}, "point1": {"value": 10}},
+                want=[{"op": "copy", "from": "/point0", "path": "/point1"}],
+                skip_patch=False,
+            ),
+            C(
+                src=[{"name": "foo"}, {"name": "bar"}],
+                dst=[{"name": "boo"}, {"name": "foo"}, {"name": "bar"}],
+                want=[{"op": "add", "path": "/0", "value": {"name": "boo"}}],
+                skip_patch=False,
+            ),
+            C(
+                src=["x", "y", "z"],
+                dst=["z", "x", "y"],
+                want=[{"op": "move", "from": "/2", "path": "/0"}],
+                skip_patch=False,
+            ),
+            C(
+                src=[1, 2, 3, 4],
+                dst=[1, 2],
+                want=[
+                    {"op": "remove", "path": "/3"},
+                    {"op": "remove", "path": "/2"},
                 ],
                 skip_patch=False,
             ),
@@ -140,3 +165,85 @@ class Tests(unittest.TestCase):
                     sorted([json.dumps(x, sort_keys=True) for x in got]),
                     sorted([json.dumps(x, sort_keys=True) for x in c.want]),
                 )
+
+
+class ApplyPatchTests(unittest.TestCase):
+    def _callFUT(self, doc, ops, *, inplace=False):
+        from dictknife.jsonknife.patch import apply_patch
+
+        return apply_patch(doc, ops, inplace=inplace)
+
+    def test_ops(self) -> None:
+        doc = {"person": {"name": "foo", "skills": ["python", "go"]}}
+        ops = [
+            {"op": "test", "path": "/person/name", "value": "foo"},
+            {"op": "replace", "path": "/person/name", "value": "bar"},
+            {"op": "add", "path": "/person/skills/0", "value": "rust"},
+            {"op": "add", "path": "/person/skills/-", "value": "c"},
+            {"op": "remove", "path": "/person/skills/2"},
+            {"op": "move", "path": "/skills", "from": "/person/skills"},
+            {"op": "copy", "path": "/person/nickname", "from": "/person/name"},
+        ]
+        got = self._callFUT(doc, ops)
+        want = {
+            "person": {"name": "bar", "nickname": "bar"},
+            "skills": ["rust", "python", "c"],
+        }
+        self.assertEqual(got, want)
+        self.assertEqual(  # not modified
+            doc, {"person": {"name": "foo", "skills": ["python", "go"]}}
+        )
+
+    def test_inplace(self) -> None:
+        doc = {"person": {"name": "foo"}, "other": {}}
+        got = self._callFUT(
+            doc, [{"op": "add", "path": "/person/age", "value": 20}], inplace=True
+        )
+        self.assertIs(got, doc)
+        self.assertEqual(doc, {"person": {"name": "foo", "age": 20}, "other": {}})
+
+    def test_copied_value_is_not_shared(self) -> None:
+        value = {"name": "foo"}
+        doc = {}
+        ops = [
+            {"op": "add", "path": "/x", "value": value},
+            {"op": "copy", "path": "/y", "from": "/x"},
+            {"op": "replace", "path": "/y/name", "value": "bar"},
+        ]
+        got = self._callFUT(doc, ops, inplace=True)
+        self.assertEqual(got, {"x": {"name": "foo"}, "y": {"name": "bar"}})
+        self.assertEqual(value, {"name": "foo"})
+
+    def test_errors(self) -> None:
+        doc = {"items": [1, 2]}
+        C = namedtuple("C", "op, exception")
+        cases = [
+            C(op={"op": "remove", "path": "/missing"}, exception=KeyError),
+            C(op={"op": "add", "path": "/items/3", "value": 0}, exception=KeyError),
+            C(
+                op={"op": "replace", "path": "/items/01", "value": 0},
+                exception=KeyError,
+            ),
+            C(
+                op={"op": "test", "path": "/items/0", "value": True},
+                exception=ValueError,
+            ),
+            C(
+                op={"op": "move", "path": "/items/0", "from": "/items"},
+                exception=ValueError,
+            ),
+            C(op={"op": "unknown", "path": ""}, exception=ValueError),
+        ]
+        for c in cases:
+            with self.subTest(op=c.op):
+                with self.assertRaises(c.exception):
+                    self._callFUT(doc, [c.op])
+        self.assertEqual(doc, {"items": [1, 2]})
+
+    def test_roundtrip(self) -> None:
+        from dictknife.jsonknife.patch import make_jsonpatch
+
+        src = {"items": [{"id": i} for i in range(5)], "name": "foo"}
+        dst = {"items": [{"id": 4}, {"id": 0}, {"id": 2}, {"id": 9}], "name": "bar"}
+        got = self._callFUT(src, make_jsonpatch(src, dst))
+        self.assertEqual(got, dst)
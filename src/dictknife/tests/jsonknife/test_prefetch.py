@@ -0,0 +1,52 @@
+import os.path
+import tempfile
+import unittest
+
+
+class Tests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        files = {
+            "main.json": '{"definitions": {"person": {"$ref": "person.json"}, "team": {"$ref": "team.json#/definitions/team"}}}',
+            "person.json": '{"type": "object", "properties": {"name": {"$ref": "name.json"}}}',
+            "team.json": '{"definitions": {"team": {"type": "array", "items": {"$ref": "person.json"}}}}',
+            "name.json": '{"type": "string"}',
+        }
+        for name, content in files.items():
+            with open(os.path.join(self.tmpdir.name, name), "w") as wf:
+                wf.write(content)
+
+    def _callFUT(self, filename, **kwargs):
+        from dictknife.jsonknife import bundle
+
+        return bundle(filename, **kwargs)
+
+    def _makeOne(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from dictknife.jsonknife import Prefetcher
+
+        submitted = []
+
+        class Executor(ThreadPoolExecutor):
+            def submit(self, fn, loader, filename, *args, **kwargs):
+                submitted.append(os.path.basename(filename))
+                return super().submit(fn, loader, filename, *args, **kwargs)
+
+        return Prefetcher(Executor(max_workers=2)), submitted
+
+    def test_it(self) -> None:
+        filename = os.path.join(self.tmpdir.name, "main.json")
+        expected = self._callFUT(filename)
+
+        prefetcher, submitted = self._makeOne()
+        with prefetcher:
+            got = self._callFUT(filename, prefetcher=prefetcher)
+
+        self.assertEqual(got, expected)
+        self.assertEqual(sorted(submitted), ["name.json", "person.json", "team.json"])
+        self.assertEqual(prefetcher.futures, {}, msg="all prefetched files are used")
+
+
+if __name__ == "__main__":
+    unittest.main()
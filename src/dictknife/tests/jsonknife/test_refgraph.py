@@ -0,0 +1,128 @@
+import os.path
+import tempfile
+import unittest
+
+
+class Tests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        files = {
+            "main.json": '{"definitions": {"person": {"$ref": "person.json"}, "team": {"$ref": "team.json#/definitions/team"}}}',
+            "person.json": '{"type": "object", "properties": {"name": {"$ref": "name.json"}, "team": {"$ref": "team.json#/definitions/team"}}}',
+            "team.json": '{"definitions": {"team": {"type": "array", "items": {"$ref": "person.json"}}}}',
+            "name.json": '{"type": "string"}',
+        }
+        for name, content in files.items():
+            with open(os.path.join(self.tmpdir.name, name), "w") as wf:
+                wf.write(content)
+
+    def _path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def _makeOne(self, filename):
+        from dictknife.jsonknife import get_resolver
+        from dictknife.jsonknife import RefGraph
+
+        return RefGraph.from_resolver(get_resolver(filename))
+
+    def test_sites(self) -> None:
+        graph = self._makeOne(self._path("main.json"))
+
+        actual = [(os.path.basename(site.file), site.pointer) for site in graph.sites]
+        expected = [
+            ("main.json", "/definitions/person"),
+            ("main.json", "/definitions/team"),
+            ("person.json", "/properties/name"),
+            ("person.json", "/properties/team"),
+            ("team.json", "/definitions/team/items"),
+        ]
+        self.assertEqual(actual, expected)
+
+    def test_referrers(self) -> None:
+        graph = self._makeOne(self._path("main.json"))
+
+        actual = [
+            site.globalref
+            for site in graph.referrers((self._path("team.json"), "/definitions/team"))
+        ]
+        expected = [
+            (self._path("main.json"), "/definitions/team"),
+            (self._path("person.json"), "/properties/team"),
+        ]
+        self.assertEqual(actual, expected)
+
+    def test_sites_in(self) -> None:
+        graph = self._makeOne(self._path("main.json"))
+        doc = graph.resolvers[self._path("person.json")].doc
+
+        actual = [site.ref for site in graph.sites_in(doc["properties"])]
+        self.assertEqual(actual, ["name.json", "team.json#/definitions/team"])
+        self.assertEqual(graph.sites_in({}), None)  # not indexed
+        self.assertEqual(graph.sites_in(dict(doc["properties"])), None)  # copied
+
+    def test_iterate_in(self) -> None:
+        from dictknife import DictWalker
+        from dictknife.jsonknife.accessor import is_ref
+
+        graph = self._makeOne(self._path("main.json"))
+        doc = graph.resolvers[self._path("person.json")].doc
+
+        # the paths are relative to the subtree, same as DictWalker
+        for sub in [doc, doc["properties"], doc["properties"]["team"]]:
+            actual = [(tuple(path), id(d)) for path, d in graph.iterate_in(sub)]
+            expected = [
+                (tuple(path), id(d)) for path, d in DictWalker([is_ref]).iterate(sub)
+            ]
+            self.assertEqual(actual, expected)
+        self.assertEqual(graph.iterate_in({}), None)  # not indexed
+
+    def test_index(self) -> None:
+        from dictknife.jsonknife import get_resolver
+        from dictknife.jsonknife import RefGraph
+
+        graph = RefGraph()
+        sites = graph.index(get_resolver(self._path("person.json")))
+
+        # the referenced files are not loaded (and not resolved)
+        self.assertEqual(list(graph.resolvers.keys()), [self._path("person.json")])
+        self.assertEqual([site.target for site in sites], [None, None])
+
+    def test_bundle_loads_only_reachable_files(self) -> None:
+        from dictknife.jsonknife import bundle
+
+        with open(self._path("partial.json"), "w") as wf:
+            wf.write(
+                '{"definitions": {"a": {"properties": {"p": {"$ref": "name.json"}}},'
+                ' "b": {"$ref": "person.json"}, "c": {"$ref": "missing.json"}}}'
+            )
+        loaded = []
+        got = bundle(
+            self._path("partial.json") + "#/definitions/a",
+            onload=lambda d, resolver: loaded.append(os.path.basename(resolver.name)),
+        )
+        self.assertEqual(got["definitions"]["name"], {"type": "string"})
+        self.assertNotIn("person.json", loaded)
+
+    def test_toposort(self) -> None:
+        graph = self._makeOne(self._path("main.json"))
+
+        actual = [
+            (os.path.basename(filename), pointer)
+            for filename, pointer in graph.toposort()
+        ]
+        # person.json <-> team.json#/definitions/team is circular
+        expected = [
+            ("name.json", ""),
+            ("team.json", "/definitions/team"),
+            ("person.json", ""),
+        ]
+        self.assertEqual(actual, expected)
+
+    def test_unresolved(self) -> None:
+        with open(self._path("broken.json"), "w") as wf:
+            wf.write('{"x": {"$ref": "missing.json"}, "y": {"$ref": "#/z"}}')
+        graph = self._makeOne(self._path("broken.json"))
+
+        self.assertEqual([site.target for site in graph.sites][0], None)
+        self.assertEqual(graph.dependencies((self._path("broken.json"), "/z")), [])
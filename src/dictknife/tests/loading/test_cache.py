@@ -0,0 +1,76 @@
+import os
+import os.path
+import tempfile
+import unittest
+
+
+class LoadfileTests(unittest.TestCase):
+    def setUp(self) -> None:
+        from dictknife import loading
+        from dictknife.loading._cache import FileCache
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cache = FileCache(os.path.join(self.tmpdir.name, "cache"))
+
+        original = loading.dispatcher.loader.cache
+        loading.dispatcher.loader.cache = self.cache
+        self.addCleanup(setattr, loading.dispatcher.loader, "cache", original)
+
+    def _callFUT(self, filename, **kwargs):
+        from dictknife import loading
+
+        return loading.loadfile(filename, **kwargs)
+
+    def _write(self, filename, content):
+        path = os.path.join(self.tmpdir.name, filename)
+        with open(path, "w") as wf:
+            wf.write(content)
+        return path
+
+    def test_it(self) -> None:
+        path = self._write("person.yaml", "name: foo\n")
+        self.assertEqual(self._callFUT(path), {"name": "foo"})
+
+        # cached
+        self.assertEqual(len(os.listdir(self.cache.dirpath)), 1)
+        self.assertEqual(self._callFUT(path), {"name": "foo"})
+        self.assertEqual(len(os.listdir(self.cache.dirpath)), 1)
+
+        # modified
+        self._write("person.yaml", "name: bar\nage: 20\n")
+        self.assertEqual(self._callFUT(path), {"name": "bar", "age": 20})
+        self.assertEqual(len(os.listdir(self.cache.dirpath)), 2)
+
+    def test_cache_hit(self) -> None:
+        from dictknife import loading
+
+        path = self._write("person.json", '{"name": "foo"}')
+        self.assertEqual(self._callFUT(path), {"name": "foo"})
+
+        key = loading.dispatcher.loader._make_cache_key(
+            path, format=None, encoding=None, errors=None
+        )
+        self.cache.set(key, {"name": "cached"})
+        self.assertEqual(self._callFUT(path), {"name": "cached"})
+        self.assertEqual(self._callFUT(path, format="yaml"), {"name": "foo"})
+
+
+class EvictTests(unittest.TestCase):
+    def test_it(self) -> None:
+        import time
+        from dictknife.loading._cache import FileCache
+
+        with tempfile.TemporaryDirectory() as d:
+            cache = FileCache(d, max_size=1000)
+            for i in range(5):
+                cache.set(str(i), "x" * 300)
+                time.sleep(0.01)
+            self.assertEqual(cache.get("0"), None)
+            self.assertEqual(cache.get("1"), None)
+            self.assertEqual(cache.get("4"), "x" * 300)
+            self.assertLessEqual(cache._size, 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,6 +31,7 @@ class Tests(unittest.TestCase):
             C(format="json", input=iterator(), output='''[\n  {\n    "name": "foo"\n  },\n  {\n    "name": "bar"\n  },\n  {\n    "name": "boo"\n  }\n]\n'''),
             C(format="yaml", input=iterator(), output='''- name: foo\n- name: bar\n- name: boo\n'''),
             C(format="md", input=iterator(), output='''| name |\n| :--- |\n| foo |\n| bar |\n| boo |\n'''),
+            C(format="jsonl", input=iterator(), output='''{"name":"foo"}\n{"name":"bar"}\n{"name":"boo"}\n'''),
         ]
         # yapf: enable
         for c in candidates:
@@ -38,6 +39,69 @@ class Tests(unittest.TestCase):
                 got = self._callFUT(c.input, format=c.format)
                 self.assertEqual(got.strip(), c.output.strip())
 
+    def test_dumpfile_with_iterator__streaming(self) -> None:
+        consumed = []
+
+        def iterator():
+            for name in ["foo", "bar"]:
+                consumed.append(name)
+                yield {"name": name}
+
+        class Writer:
+            def __init__(self):
+                self.written = []
+
+            def write(self, s):
+                # each record is written before the next one is consumed
+                self.written.append((s, list(consumed)))
+
+        from dictknife import loading
+
+        w = Writer()
+        loading.dump(iterator(), w, format="jsonl")
+        self.assertEqual(
+            w.written,
+            [
+                ('{"name":"foo"}', ["foo"]),
+                ("\n", ["foo"]),
+                ('{"name":"bar"}', ["foo", "bar"]),
+                ("\n", ["foo", "bar"]),
+            ],
+        )
+
+        consumed.clear()
+        w = Writer()
+        loading.dump(iterator(), w, format="json", extra={"indent": None})
+        self.assertEqual(
+            w.written,
+            [
+                ("[", ["foo"]),
+                ('{"name": "foo"}', ["foo"]),
+                (", ", ["foo", "bar"]),
+                ('{"name": "bar"}', ["foo", "bar"]),
+                ("]", ["foo", "bar"]),
+            ],
+        )
+
+    def test_openfile(self) -> None:
+        import os.path
+        import tempfile
+        from dictknife import loading
+
+        with tempfile.TemporaryDirectory() as d:
+            src = os.path.join(d, "people.csv")
+            dst = os.path.join(d, "people.tsv")
+            with open(src, "w") as wf:
+                wf.write("name,age\nfoo,20\nbar,21\n")
+
+            with loading.openfile(src) as rows:
+                self.assertTrue(hasattr(rows, "__next__"), msg="not materialized")
+                loading.dumpfile(rows, dst)
+
+            with open(dst, newline="") as rf:
+                got = rf.read()
+        self.assertEqual(got, '"name"\t"age"\r\n"foo"\t"20"\r\n"bar"\t"21"\r\n')
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+
+class Tests(unittest.TestCase):
+    def _getTarget(self):
+        from dictknife.loading._json import get_backend
+
+        return get_backend
+
+    def _makeOne(self, name):
+        try:
+            return self._getTarget()(name)
+        except ImportError as e:
+            self.skipTest(str(e))
+
+    def test_same_as_stdlib(self) -> None:
+        import json
+        import datetime
+
+        d = {
+            "name": "foo/é",
+            "age": 20,
+            "values": [1, 2.5, None, True, {}, []],
+            "1": datetime.date(2000, 1, 1),
+            "big": 2**70,
+            "nan": float("nan"),
+            "infs": [float("inf"), {"x": float("-inf")}],
+        }
+        s = json.dumps(d, indent=2, default=str)
+        for name in ["json", "orjson", "ujson"]:
+            with self.subTest(name=name):
+                backend = self._makeOne(name)
+                for kwargs in [
+                    dict(indent=2, ensure_ascii=False, default=str),
+                    dict(indent=2, ensure_ascii=False, default=str, sort_keys=True),
+                    dict(indent=None, ensure_ascii=True, default=str),
+                    dict(
+                        indent=None,
+                        ensure_ascii=False,
+                        default=str,
+                        separators=(",", ":"),
+                    ),
+                ]:
+                    self.assertEqual(
+                        backend.dumps(d, **kwargs), json.dumps(d, **kwargs)
+                    )
+                self.assertEqual(  # nan != nan
+                    repr(backend.loads(s, object_pairs_hook=dict)),
+                    repr(json.loads(s)),
+                )
+
+    def test_unsupported(self) -> None:
+        with self.assertRaises(ValueError):
+            self._getTarget()("yaml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+
+class Tests(unittest.TestCase):
+    def _callFUT(self, s, *, format="jsonl", errors=None):
+        from io import StringIO
+        from dictknife import loading
+
+        return loading.load(StringIO(s), format=format, errors=errors)
+
+    def test_load(self) -> None:
+        got = self._callFUT('{"name": "foo"}\n\n{"name": "bar", "age": 20}\n')
+        self.assertTrue(hasattr(got, "__next__"), msg="lazy")
+        self.assertEqual(list(got), [{"name": "foo"}, {"name": "bar", "age": 20}])
+
+    def test_load__errors(self) -> None:
+        s = '{"name": "foo"}\n{"name": \n{"name": "bar"}\n'
+        with self.assertRaises(ValueError):
+            list(self._callFUT(s))
+
+        got = self._callFUT(s, errors="ignore")
+        self.assertEqual(list(got), [{"name": "foo"}, {"name": "bar"}])
+
+    def test_guess_format(self) -> None:
+        from dictknife import loading
+
+        self.assertEqual(loading.guess_format("events.jsonl"), "jsonl")
+        self.assertEqual(loading.guess_format("events.ndjson"), "jsonl")
+
+
+if __name__ == "__main__":
+    unittest.main()
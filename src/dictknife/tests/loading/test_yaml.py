@@ -0,0 +1,57 @@
+import unittest
+
+
+class LoadTests(unittest.TestCase):
+    def _callFUT(self, s, **kwargs):
+        from io import StringIO
+        from dictknife.loading import yaml
+
+        return yaml.load(StringIO(s), **kwargs)
+
+    def test_typ(self) -> None:
+        s = '# comment\nname: "foo"\nitems: [1, 2]\n'
+        for typ in ["rt", "safe"]:
+            with self.subTest(typ=typ):
+                got = self._callFUT(s, typ=typ)
+                self.assertEqual(got, {"name": "foo", "items": [1, 2]})
+
+        got = self._callFUT(s, typ="safe")
+        self.assertIs(type(got), dict)
+        self.assertIs(type(got["name"]), str)
+        self.assertIs(type(got["items"]), list)
+
+    def test_roundtrip__after_other_loading(self) -> None:
+        from io import StringIO
+        from dictknife.loading import yaml
+
+        s = "name: 'foo'  # comment\n"
+        d = self._callFUT(s)
+        for i in range(3):
+            self._callFUT("- {}\n".format(i))
+
+        o = StringIO()
+        yaml.dump(d, o)
+        self.assertEqual(o.getvalue(), s)
+
+
+class PoolTests(unittest.TestCase):
+    def _callFUT(self, typ):
+        from dictknife.loading._yaml import _get_yaml
+
+        return _get_yaml(typ)
+
+    def test_reused_per_thread(self) -> None:
+        import threading
+
+        self.assertIs(self._callFUT("rt"), self._callFUT("rt"))
+        self.assertIsNot(self._callFUT("rt"), self._callFUT("safe"))
+
+        got = []
+        th = threading.Thread(target=lambda: got.append(self._callFUT("rt")))
+        th.start()
+        th.join()
+        self.assertIsNot(got[0], self._callFUT("rt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -73,3 +73,25 @@ class DeepEqualTests(unittest.TestCase):
         ]
         self.assertNotEqual(d0, d1)
         self.assertTrue(self._callFUT(d0, d1, normalize=True))
+
+    def test_not_equal(self) -> None:
+        from collections import namedtuple
+
+        C = namedtuple("C", "d0 d1 normalize")
+        candidates = [
+            C(d0={"a": 1}, d1={"a": 1, "b": None}, normalize=False),
+            C(d0=[1, 2], d1=[2, 1], normalize=False),
+            C(d0=[1, 1, 2], d1=[1, 2, 2], normalize=True),
+            C(d0=[[1, 2], [3]], d1=[[1], [2, 3]], normalize=True),
+            C(d0={"a": []}, d1={"a": {}}, normalize=True),
+        ]
+        for c in candidates:
+            with self.subTest(d0=c.d0, d1=c.d1, normalize=c.normalize):
+                self.assertFalse(self._callFUT(c.d0, c.d1, normalize=c.normalize))
+
+    def test_not_modified(self) -> None:
+        d0 = {"xs": [{"ys": [3, 2, 1]}, {"ys": [1]}]}
+        d1 = {"xs": [{"ys": [1]}, {"ys": [1, 2, 3]}]}
+        self.assertTrue(self._callFUT(d0, d1, normalize=True))
+        self.assertEqual(d0, {"xs": [{"ys": [3, 2, 1]}, {"ys": [1]}]})
+        self.assertEqual(d1, {"xs": [{"ys": [1]}, {"ys": [1, 2, 3]}]})
@@ -55,3 +55,58 @@ class TestDeepMerge(unittest.TestCase):
             with self.subTest(d0=c.d0, d1=c.d1):
                 actual = self._callFUT(c.d0, c.d1, override=c.override)
                 self.assertEqual(actual, c.expected)
+
+    def test_addtoset(self) -> None:
+        from collections import OrderedDict
+
+        n = 100  # large enough to use the hash-based index
+        d0 = {"xs": [{"id": i, "tags": [i % 3]} for i in range(n)] + [1, [1]]}
+        d1 = {
+            "xs": [{"tags": [i % 3], "id": i} for i in range(n // 2, n + n // 2)]
+            + [1.0, True, (1,), [1], OrderedDict([("id", 0), ("tags", [0])])]
+        }
+        actual = self._callFUT(d0, d1)
+        expected = {
+            "xs": [{"id": i, "tags": [i % 3]} for i in range(n)]
+            + [1, [1]]
+            + [{"id": i, "tags": [i % 3]} for i in range(n, n + n // 2)]
+            + [(1,)]
+        }
+        self.assertEqual(actual, expected)
+
+    def test_many(self) -> None:
+        from functools import reduce
+
+        ds = [
+            {"a": {"b": [i % 3], "c%d" % i: i}, "xs": [{"i": i % 4}], "n": i}
+            for i in range(10)
+        ]
+        ds.insert(3, None)
+        ds.insert(5, {})
+        for method in ["addtoset", "append", "merge", "replace"]:
+            with self.subTest(method=method):
+                actual = self._callFUT(*ds, method=method)
+                expected = reduce(
+                    lambda d, x: self._callFUT(d, x, method=method), ds[1:], ds[0]
+                )
+                self.assertEqual(actual, expected)
+
+    def test_inplace(self) -> None:
+        import copy
+
+        for method in ["addtoset", "append", "merge", "replace"]:
+            with self.subTest(method=method):
+                shared = {"x": {"y": [1]}}
+                d0 = {"a": {"b": [1]}, "c": 1}
+                d1 = {"a": {"b": [2], "d": shared}, "e": shared}
+                d2 = {"a": {"d": {"x": {"y": [2], "z": 3}}}}
+                expected = self._callFUT(
+                    copy.deepcopy(d0), d1, copy.deepcopy(d2), method=method
+                )
+                snapshot = copy.deepcopy([d1, d2])
+
+                actual = self._callFUT(d0, d1, d2, method=method, inplace=True)
+                self.assertIs(actual, d0)
+                self.assertEqual(actual, expected)
+                self.assertEqual([d1, d2], snapshot, msg="not modified!!")
+                self.assertIs(actual["e"], shared)  # not copied
@@ -8,7 +8,7 @@ class DiffRowsTests(unittest.TestCase):
     def _callFUT(self, d0, right):
         from dictknife.diff import diff_rows
 
-        return diff_rows(d0, right)
+        return list(diff_rows(d0, right))
 
     def test_primitives(self) -> None:
         C = namedtuple("C", "left, right, expected, msg")
@@ -98,5 +98,66 @@ class DiffRowsTests(unittest.TestCase):
         self.assertListEqual(got, expected)
 
 
+class DiffTests(unittest.TestCase):
+    maxDiff = None
+
+    def _callFUT(self, d0, d1, **kwargs):
+        from dictknife.diff import diff
+
+        return list(diff(d0, d1, **kwargs))
+
+    def _unified_diff(self, d0, d1, *, sort_keys=False, n=3):
+        import difflib
+        import json
+
+        return list(
+            difflib.unified_diff(
+                json.dumps(d0, indent=2, sort_keys=sort_keys).split("\n"),
+                json.dumps(d1, indent=2, sort_keys=sort_keys).split("\n"),
+                fromfile="left",
+                tofile="right",
+                lineterm="",
+                n=n,
+            )
+        )
+
+    def test_same_as_unified_diff(self) -> None:
+        d0 = {
+            "name": "foo",
+            "age": 20,
+            "items": [{"id": i, "tags": ["x", "y"]} for i in range(20)],
+            "z": {"a": [], "b": {}},
+        }
+        C = namedtuple("C", "msg, d1")
+        candidates = [
+            C(msg="no diff", d1={**d0}),
+            C(msg="update", d1={**d0, "age": 21}),
+            C(msg="insert key", d1={"x": None, **d0, "w": 1}),
+            C(msg="delete key", d1={k: v for k, v in d0.items() if k != "age"}),
+            C(msg="insert element", d1={**d0, "items": [{"id": -1}, *d0["items"]]}),
+            C(msg="delete element", d1={**d0, "items": d0["items"][1:]}),
+            C(msg="nested", d1={**d0, "z": {"a": [1], "b": {"c": [True, None]}}}),
+            C(msg="type", d1={**d0, "age": 20.0, "items": {"id": 0}}),
+        ]
+        for c in candidates:
+            for sort_keys in [False, True]:
+                with self.subTest(msg=c.msg, sort_keys=sort_keys):
+                    got = self._callFUT(
+                        d0, c.d1, fromfile="left", tofile="right", sort_keys=sort_keys
+                    )
+                    expected = self._unified_diff(d0, c.d1, sort_keys=sort_keys)
+                    self.assertListEqual(got, expected)
+
+    def test_large(self) -> None:
+        d0 = {"items": [{"id": i, "value": "v{}".format(i)} for i in range(2000)]}
+        d1 = {"items": [{"id": i, "value": "v{}".format(i)} for i in range(2000)]}
+        d1["items"][10]["value"] = "changed"
+        d1["items"][1500]["value"] = "changed"
+
+        got = self._callFUT(d0, d1, fromfile="left", tofile="right", n=1)
+        expected = self._unified_diff(d0, d1, n=1)
+        self.assertListEqual(got, expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+
+class FingerprintTests(unittest.TestCase):
+    def _callFUT(self, d):
+        from dictknife import fingerprint
+
+        return fingerprint(d)
+
+    def test_equal(self) -> None:
+        from collections import OrderedDict
+        from collections import namedtuple
+
+        C = namedtuple("C", "left right")
+        candidates = [
+            C(left={"a": 1, "b": 2}, right={"b": 2, "a": 1}),
+            C(left={"a": [1, 2]}, right=OrderedDict([("a", (1, 2))])),
+            C(left=[1, 2.0, True], right=[1.0, 2, 1]),
+            C(left={1, "x"}, right=frozenset(["x", 1])),
+        ]
+        for c in candidates:
+            with self.subTest(left=c.left, right=c.right):
+                self.assertEqual(self._callFUT(c.left), self._callFUT(c.right))
+
+    def test_not_equal(self) -> None:
+        from collections import namedtuple
+
+        C = namedtuple("C", "left right")
+        candidates = [
+            C(left={"a": 1}, right={"a": "1"}),
+            C(left={"a": 1}, right={"a": 1, "b": None}),
+            C(left=[1, [2]], right=[[1], 2]),
+            C(left=["ab"], right=["a", "b"]),
+            C(left={}, right=[]),
+            C(left=[1, 2], right=[2, 1]),
+            C(left=1.5, right=1),
+        ]
+        for c in candidates:
+            with self.subTest(left=c.left, right=c.right):
+                self.assertNotEqual(self._callFUT(c.left), self._callFUT(c.right))
+
+    def test_stable(self) -> None:
+        # must not be changed (e.g. stored as cache key)
+        actual = self._callFUT({"a": [1, "x", None]})
+        self.assertEqual(actual, "8f5a86779f810eade1b18d9f9f2c4418")
+
+
+class FingerprinterTests(unittest.TestCase):
+    def _makeOne(self):
+        from dictknife.fingerprint import Fingerprinter
+
+        return Fingerprinter()
+
+    def test_cache(self) -> None:
+        shared = {"x": [1, 2, 3]}
+        d = {"a": shared, "b": [shared, shared]}
+        target = self._makeOne()
+
+        actual = target.digest(d)
+        self.assertEqual(len(target.cache), 4)  # d, shared, shared["x"], d["b"]
+        self.assertEqual(target.digest(d), actual)
+
+        shared["x"].append(4)
+        self.assertEqual(target.digest(d), actual, msg="cached")
+        target.forget(shared["x"])
+        target.forget(shared)
+        target.forget(d["b"])
+        target.forget(d)
+        self.assertNotEqual(target.digest(d), actual)
@@ -1,4 +1,5 @@
 import unittest
+from collections import namedtuple
 
 
 class Tests(unittest.TestCase):
@@ -50,3 +51,69 @@ class Tests(unittest.TestCase):
         self.assertNotEqual(id(got), id(v), msg="list")
         self.assertNotEqual(id(got[0]), id(v[0]), msg="dict")
         # self.assertEqual(id(got[0]["1"]), id(v[0]["1"]), msg="item")
+
+    def test_scalars(self) -> None:
+        C = namedtuple("C", "input, output")
+        candidates = [
+            C(input="true", output=True),
+            C(input="False", output=False),
+            C(input="Trueish", output=False),  # not anchored (compatibility)
+            C(input="0", output=0),
+            C(input="-10", output=-10),
+            C(input="007", output="007"),
+            C(input="1.5", output=1.5),
+            C(input="-.5", output=-0.5),
+            C(input="\u0661.5", output=1.5),  # \d matches non-ascii digits
+            C(input=" 1", output=" 1"),
+            C(input="1_000", output="1_000"),
+            C(input="", output=""),
+            C(input="foo", output="foo"),
+            C(input=None, output=None),
+        ]
+        for c in candidates:
+            with self.subTest(input=c.input):
+                got = self._callFUT(c.input)
+                self.assertEqual((got, type(got)), (c.output, type(c.output)))
+
+    def test_custom_guesser(self) -> None:
+        from dictknife.langhelpers import reify
+        from dictknife.guessing import Guesser
+        import re
+
+        class MyGuesser(Guesser):
+            @reify
+            def is_int(self):
+                return re.compile(r"-?\d+$").match
+
+        got = self._callFUT(["007", "yes"], guesser_factory=MyGuesser)
+        self.assertEqual(got, [7, "yes"])
+
+        got = self._callFUT(["007", "yes"], default=lambda v: v.upper())
+        self.assertEqual(got, ["007", "YES"])
+
+
+class ColumnGuesserTests(unittest.TestCase):
+    def _getTarget(self):
+        from dictknife.guessing import ColumnGuesser
+
+        return ColumnGuesser
+
+    def _makeOne(self, *args, **kwargs):
+        return self._getTarget()(*args, **kwargs)
+
+    def test_same_as_guess(self) -> None:
+        from dictknife.guessing import guess
+
+        rows = [
+            {"int": "1", "float": "0.5", "bool": "true", "str": "foo", "x": "1"},
+            {"int": "-20", "float": ".5", "bool": "False", "str": "", "x": "bar"},
+            # after sampling, falling back if mismatched
+            {"int": "1.5", "float": "1", "bool": "yes", "str": "10", "x": "true"},
+            {"int": "007", "float": "nan", "bool": "0", "str": "inf", "x": None},
+            {"int": " 1", "float": "1_0", "bool": "Trueish", "str": "-", "x": ["1"]},
+        ]
+        g = self._makeOne(sample_size=2)
+        actual = [g.guess(dict(row)) for row in rows]
+        expected = [guess(dict(row)) for row in rows]
+        self.assertEqual(repr(actual), repr(expected))  # nan != nan
+        self.assertEqual(sorted(g.converters.keys()), ["bool", "float", "int", "str"])
@@ -31,3 +31,83 @@ class IteratorTests(unittest.TestCase):
         ]
 
         self.assertEqual(s, expected)
+
+    def test_order(self) -> None:
+        from dictknife.jsonknife.accessor import is_ref
+
+        d = {
+            "a": {"$ref": "#/x", "b": {"$ref": "#/y"}},
+            "c": [{"$ref": "#/z"}, {"$ref": 1}],
+        }
+        iterator = self._makeOne([is_ref])
+        actual = [(tuple(path), sd["$ref"]) for path, sd in iterator.iterate(d)]
+        expected = [
+            (("a", "$ref"), "#/x"),
+            (("a", "b", "$ref"), "#/y"),
+            (("c", 0, "$ref"), "#/z"),
+        ]
+        self.assertEqual(actual, expected)
+
+    def test_depth(self) -> None:
+        d = {"a": {"b": 1, "x": {"b": 2, "a": {"b": 3}}}}
+        iterator = self._makeOne(["a", "b"])
+        # depth is decremented on each matched step (not on each level)
+        self.assertEqual([sd["b"] for _, sd in iterator.iterate(d, depth=1)], [])
+        self.assertEqual([sd["b"] for _, sd in iterator.iterate(d, depth=2)], [1, 2, 3])
+
+    def test_mutation_while_walking(self) -> None:
+        # the keys are snapshotted, the values are accessed lazily
+        d = {"x": {"$ref": "#/a"}, "y": {"z": {"$ref": "#/b"}}}
+        iterator = self._makeOne(["$ref"])
+        actual = []
+        for path, sd in iterator.iterate(d):
+            actual.append(sd.pop("$ref"))
+            sd["w"] = {"$ref": "#/c"}  # not walked
+            d["y"] = {"$ref": "#/d"}
+        self.assertEqual(actual, ["#/a", "#/d"])
+
+
+class MultiWalkerTests(unittest.TestCase):
+    def _makeOne(self, *args, **kwargs):
+        from dictknife import MultiDictWalker
+
+        return MultiDictWalker(*args, **kwargs)
+
+    def test_it(self) -> None:
+        from dictknife import DictWalker
+        from dictknife.operators import Regexp
+        from dictknife.jsonknife.accessor import is_ref
+
+        d = {
+            "definitions": {
+                "person": {
+                    "x-table": "people",
+                    "properties": {
+                        "name": {"type": "string", "example": "foo"},
+                        "team": {"$ref": "#/definitions/team"},
+                    },
+                },
+                "team": {"x-table": "teams", "example": {"name": "bar"}},
+            }
+        }
+        queries = {"ref": [is_ref], "ext": [Regexp("^x-")], "example": ["example"]}
+
+        actual = [
+            (name, tuple(path)) for name, path, _ in self._makeOne(queries).walk(d)
+        ]
+        expected = [
+            ("ext", ("definitions", "person", "x-table")),
+            ("example", ("definitions", "person", "properties", "name", "example")),
+            ("ref", ("definitions", "person", "properties", "team", "$ref")),
+            ("ext", ("definitions", "team", "x-table")),
+            ("example", ("definitions", "team", "example")),
+        ]
+        self.assertEqual(actual, expected)
+
+        # same as DictWalker, for each query
+        for name, qs in queries.items():
+            with self.subTest(name=name):
+                self.assertEqual(
+                    [tuple(path) for path, _ in DictWalker(qs).walk(d)],
+                    [tuple(path) for qname, path in actual if qname == name],
+                )
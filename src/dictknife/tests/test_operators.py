@@ -73,3 +73,33 @@ class OperatorsTests(unittest.TestCase):
             with self.subTest(op=op, value=c.value):
                 actual = self._callFUT(op, c.value)
                 self.assertEqual(actual, c.expected)
+
+
+class CompileMatcherTests(unittest.TestCase):
+    def _callFUT(self, op):
+        from dictknife.operators import compile_matcher
+
+        return compile_matcher(op)
+
+    def test_same_as_apply(self) -> None:
+        from dictknife.operators import apply, And, Or, Not, Regexp, ANY
+
+        def is_string(k, v):
+            return hasattr(v, "startswith")
+
+        ops = [
+            "xx",
+            ANY,
+            Regexp("^x+$"),
+            Not("x"),
+            Or(["x", "xxx"]),
+            And([Not("x"), "xx", Not("xxx")]),
+            And(["xx", is_string]),
+            is_string,
+        ]
+        for op in ops:
+            m = self._callFUT(op)
+            for k in ["x", "xx", "xxx"]:
+                for v in ["v", 1]:
+                    with self.subTest(op=op, k=k, v=v):
+                        self.assertEqual(bool(m(k, v)), bool(apply(op, k, v)))
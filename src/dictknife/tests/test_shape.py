@@ -132,3 +132,48 @@ class Tests(unittest.TestCase):
                 got = self._callFUT(c.input, squash=c.squash, skiplist=c.skiplist)
                 got = [row.path for row in got]
                 self.assertEqual(c.output, got)
+
+    def test_iterator(self) -> None:
+        rows = [{"name": "foo", "age": 10}, {"name": "bar", "nickname": "B"}]
+        want = self._callFUT(rows, squash=True)
+        got = self._callFUT(iter(rows), squash=True)
+        self.assertEqual(want, got)
+
+
+class StateTests(unittest.TestCase):
+    def _getTarget(self):
+        from dictknife.shape import _State
+
+        return _State
+
+    def _makeOne(self, *args, **kwargs):
+        return self._getTarget()(*args, **kwargs)
+
+    def test_examples_are_bounded(self) -> None:
+        s = self._makeOne(max_examples=3)
+        for i in range(100):
+            s.emit(["x"], i)
+        s.emit(["x"], "foo")
+
+        self.assertEqual(s.count(("x",)), 101)
+        self.assertEqual(s.types[("x",)], {int, str})
+        self.assertEqual(len(s.examples[("x",)]), 3)
+        self.assertEqual(s.examples[("x",)][0], 0)  # the first one is kept
+
+    def test_merge(self) -> None:
+        from dictknife.shape import shape, merge_states, Traverser
+
+        items = [
+            {"name": "foo", "age": 10},
+            {"name": "bar", "skills": ["x"]},
+            {"name": "boo", "age": "?", "skills": []},
+        ]
+        for k in range(len(items) + 1):
+            with self.subTest(k=k):
+                states = [
+                    Traverser().traverse_items(items[:k]),
+                    Traverser().traverse_items(items[k:]),
+                ]
+                actual = shape(merge_states(states), traverse=lambda s: s, squash=True)
+                expected = shape(items, squash=True)
+                self.assertEqual(actual, expected)
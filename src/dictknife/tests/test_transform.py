@@ -0,0 +1,59 @@
+import unittest
+from collections import namedtuple
+
+
+class FlattenTests(unittest.TestCase):
+    def _callFUT(self, *args, **kwargs):
+        from dictknife.transform import flatten
+
+        return flatten(*args, **kwargs)
+
+    def test_it(self) -> None:
+        C = namedtuple("C", "msg, input, output")
+        candidates = [
+            C(msg="atom", input="foo", output={None: "foo"}),
+            C(msg="empty", input={}, output={}),
+            C(
+                msg="nested",
+                input={"a": {"b": [1, {"c": None}], "d": []}, "e": "x"},
+                output={"a/b/0": 1, "a/b/1/c": None, "e": "x"},
+            ),
+            C(
+                msg="escaped",
+                input={"a/b": {"c~d": "e/f"}},
+                output={"a~1b/c~d": "e~1f"},
+            ),
+            C(
+                msg="iterator",
+                input=iter([{"a": 1}, iter([2])]),
+                output={"0/a": 1, "1/0": 2},
+            ),
+        ]
+        for c in candidates:
+            with self.subTest(msg=c.msg):
+                got = self._callFUT(c.input)
+                self.assertEqual(got, c.output)
+
+    def test_sep(self) -> None:
+        got = self._callFUT({"a": {"b": [1]}}, sep=".")
+        self.assertEqual(got, {"a.b.0": 1})
+
+    def test_iter_flatten(self) -> None:
+        from dictknife.transform import iter_flatten
+
+        d = {"a": {"b": 1}, "c": [2, 3]}
+        itr = iter_flatten(d)
+        self.assertEqual(next(itr), ("a/b", 1))
+        self.assertEqual(list(itr), [("c/0", 2), ("c/1", 3)])
+
+
+class UpdateKeysTests(unittest.TestCase):
+    def _callFUT(self, *args, **kwargs):
+        from dictknife.transform import update_keys
+
+        return update_keys(*args, **kwargs)
+
+    def test_iterator(self) -> None:
+        itr = self._callFUT(iter([{"a": {"b": 1}}, [{"c": 2}]]), key=str.upper)
+        self.assertTrue(hasattr(itr, "__next__"))  # lazy
+        self.assertEqual(list(itr), [{"A": {"B": 1}}, [{"C": 2}]])
@@ -5,12 +5,6 @@ from dictknife import accessing
 from dictknife import naming
 
 
-def _make_key(k0, k1, *, sep: str = "/"):
-    if k1 is None:
-        return _as_jsonpointer(str(k0))
-    return "{}{}{}".format(_as_jsonpointer(str(k0)), sep, k1)
-
-
 def unflatten(d, *, sep: str = "/", accessor=accessing.Accessor()):
     r = accessor.make_dict()
     for k, v in d.items():
@@ -36,24 +30,45 @@ def _fix_unflatten_list(d):
 
 
 def flatten(d, *, sep: str = "/"):
+    return dict(iter_flatten(d, sep=sep))
+
+
+def iter_flatten(d, *, sep: str = "/"):
+    """Yields the (key, value) pairs of flatten(d), lazily.
+
+    The keys of the parents are joined once per nesting level (as prefix),
+    so the leaves are not copied at each level.
+    """
+    items = _iter_flatten_items(d)
+    if items is None:
+        yield (None, _as_jsonpointer(d) if hasattr(d, "replace") else d)
+        return
+
+    prefixes = [""]
+    stack = [items]
+    while stack:
+        for k, v in stack[-1]:
+            key = prefixes[-1] + _as_jsonpointer(k)
+            items = _iter_flatten_items(v)
+            if items is not None:
+                prefixes.append(key + sep)
+                stack.append(items)
+                break
+            yield (key, _as_jsonpointer(v) if hasattr(v, "replace") else v)
+        else:
+            stack.pop()
+            prefixes.pop()
+
+
+def _iter_flatten_items(d):
     if isinstance(d, (list, tuple)):
-        return {
-            _make_key(i, k, sep=sep): v
-            for i, row in enumerate(d)
-            for k, v in flatten(row, sep=sep).items()
-        }
+        return enumerate(d)
     elif hasattr(d, "get"):
-        return {
-            _make_key(k, k2, sep=sep): v2
-            for k, v in d.items()
-            for k2, v2 in flatten(v, sep=sep).items()
-        }
+        return iter(d.items())
     elif hasattr(d, "__next__"):
-        # todo: as generator
-        return flatten(list(d), sep=sep)
+        return enumerate(d)
     else:
-        # todo: peformance improvement
-        return {None: _as_jsonpointer(d) if hasattr(d, "replace") else d}
+        return None
 
 
 def rows(d, *, kname: str = "name", vname: str = "value"):
@@ -68,6 +83,8 @@ def update_keys(d, *, key, coerce=str):  # side effect!
     elif isinstance(d, (list, tuple)):
         for x in d:
             update_keys(x, key=key, coerce=coerce)
+    elif hasattr(d, "__next__"):  # iterator, updated lazily
+        return (update_keys(x, key=key, coerce=coerce) for x in d)
     return d
 
 
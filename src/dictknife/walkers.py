@@ -1,5 +1,5 @@
 from collections import deque
-from .operators import apply
+from .operators import And, compile_matcher
 
 
 class SimpleContext(object):
@@ -80,35 +80,184 @@ class DictWalker(object):
         return self._walk(ctx, deque(self.qs), d, depth=depth)
 
     def _walk(self, ctx, qs, d, depth: int):
-        if depth == 0:
+        # iterative version of the (recursive) walking, with the compiled query plan
+        if depth == 0 or not qs:
             return
+        plan = [_compile_step(q) for q in qs]
+        size = len(plan)
+        on_found = self.on_found
 
-        if not qs:
+        # frame: (container, items, is_dict, index of query, depth, has literal key)
+        frame = _new_frame(plan, d, 0, depth)
+        if frame is None:
             return
 
-        if hasattr(d, "keys"):
-            for k, v in list(d.items()):
-                ctx.push(k)
-                if apply(qs[0], k, v):
-                    q = qs.popleft()
-                    yield from self._walk(ctx, qs, d[k], depth - 1)
-                    if len(qs) == 0:
-                        yield from self.on_found(ctx, d, k)
-                    qs.appendleft(q)
+        stack = [frame]
+        while stack:
+            d, items, is_dict, i, depth, has_literal = stack[-1]
+            literal, match = plan[i]
+            for k, v in items:
+                if is_dict:
+                    if has_literal:
+                        matched = literal == k and (match is None or match(k, v))
+                    elif literal is _missing:
+                        matched = match(k, v)
+                    else:
+                        matched = False
+
+                    if matched:
+                        if i + 1 == size:
+                            ctx.push(k)
+                            yield from on_found(ctx, d, k)
+                            ctx.pop()
+                            continue
+                        v = d[k]
+                        if v.__class__ in _atoms:
+                            continue
+                        frame = _new_frame(plan, v, i + 1, depth - 1)
+                    else:
+                        v = d[k]
+                        if v.__class__ in _atoms:
+                            continue
+                        frame = _new_frame(plan, v, i, depth)
+                elif v.__class__ in _atoms:
+                    continue
                 else:
-                    yield from self._walk(ctx, qs, d[k], depth)
-                ctx.pop()
-            return
-        elif isinstance(d, (list, tuple)):
-            for i, e in enumerate(d):
-                ctx.push(i)
-                yield from self._walk(ctx, qs, e, depth)
-                ctx.pop()
-            return
-        else:
-            return
+                    frame = _new_frame(plan, v, i, depth)
+
+                if frame is not None:
+                    ctx.push(k)
+                    stack.append(frame)
+                    break
+            else:
+                stack.pop()
+                if stack:
+                    ctx.pop()
 
     iterate = walk  # for backward compatibility
 
 
 LooseDictWalkingIterator = DictWalker  # NOQA for backward comaptibility
+
+
+class MultiDictWalker(object):
+    """Walks through a dictionary-like object once, with several named queries.
+
+    Each query finds the same values as `DictWalker(qs)`, in the same order,
+    but the traversal of the document is shared.
+
+    Attributes:
+        queries: A mapping of the query name to a list of query objects.
+
+    Example:
+        walker = MultiDictWalker({"ref": ["$ref"], "example": ["example"]})
+        for name, path, d in walker.walk(doc):
+            ...
+    """
+
+    def __init__(self, queries) -> None:
+        self.queries = queries
+
+    def walk(self, d, depth: int = -1):
+        """Yields (query name, path, container) tuples.
+
+        As DictWalker, the path is a list reused while walking (copy it, if needed).
+        """
+        if depth == 0:
+            return
+        names = list(self.queries.keys())
+        plans = [[_compile_step(q) for q in self.queries[name]] for name in names]
+        states = [(qi, 0, depth) for qi, plan in enumerate(plans) if plan]
+
+        frame = _new_multi_frame(plans, d, states)
+        if frame is None:
+            return
+
+        path: list = []
+        stack = [frame]
+        while stack:
+            d, items, is_dict, states, candidates = stack[-1]
+            for k, v in items:
+                child_states = states
+                for idx, literal, match, is_last in candidates:
+                    if literal is _missing:
+                        if not match(k, v):
+                            continue
+                    elif not (literal == k and (match is None or match(k, v))):
+                        continue
+
+                    if child_states is states:
+                        child_states = states[:]
+                    qi, i, depth = states[idx]
+                    child_states[idx] = None
+                    if is_last:
+                        path.append(k)
+                        yield names[qi], path, d
+                        path.pop()
+                    elif depth != 1:
+                        child_states[idx] = (qi, i + 1, depth - 1)
+
+                if child_states is not states:
+                    child_states = [x for x in child_states if x is not None]
+                    if not child_states:
+                        continue
+                if is_dict:
+                    v = d[k]
+                if v.__class__ in _atoms:
+                    continue
+                frame = _new_multi_frame(plans, v, child_states)
+                if frame is not None:
+                    path.append(k)
+                    stack.append(frame)
+                    break
+            else:
+                stack.pop()
+                if stack:
+                    path.pop()
+
+    iterate = walk
+
+
+_missing = object()
+
+
+def _compile_step(q):
+    # (literal key, matcher), the literal key is used for a fast path (key lookup)
+    literal, rest = _missing, None
+    if type(q) is And and q.args and not callable(q.args[0]):
+        literal, rest = q.args[0], q.args[1:]
+    elif not callable(q):
+        literal, rest = q, []
+
+    if literal is not _missing and getattr(literal, "__hash__", None) is not None:
+        return literal, (compile_matcher(And(rest)) if rest else None)
+    return _missing, compile_matcher(q)
+
+
+_atoms = frozenset([str, int, float, bool, type(None)])  # not walked
+
+
+def _new_frame(plan, d, i: int, depth: int):
+    if depth == 0:
+        return None
+    if hasattr(d, "keys"):
+        literal = plan[i][0]
+        has_literal = literal is not _missing and literal in d
+        return (d, iter(list(d.items())), True, i, depth, has_literal)
+    elif isinstance(d, (list, tuple)):
+        return (d, enumerate(d), False, i, depth, False)
+    return None
+
+
+def _new_multi_frame(plans, d, states):
+    # candidates: the queries which may match one of the keys of the container
+    if hasattr(d, "keys"):
+        candidates = []
+        for idx, (qi, i, _) in enumerate(states):
+            literal, match = plans[qi][i]
+            if literal is _missing or literal in d:
+                candidates.append((idx, literal, match, i + 1 == len(plans[qi])))
+        return (d, iter(list(d.items())), True, states, candidates)
+    elif isinstance(d, (list, tuple)):
+        return (d, enumerate(d), False, states, [])
+    return None